@@ -0,0 +1 @@
+"""Benchmark harness for Advent of Code 2025 solutions."""
\ No newline at end of file
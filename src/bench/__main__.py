@@ -0,0 +1,51 @@
+"""Command-line entry point: python -m src.bench --day 4 --size 1e6."""
+
+import argparse
+import json
+import sys
+
+from src.bench.generators import GENERATORS
+from src.bench.harness import benchmark_day
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and print or write the JSON report."""
+    parser = argparse.ArgumentParser(prog='python -m src.bench',
+                                     description='Benchmark solvers on synthetic '
+                                                 'inputs.')
+    parser.add_argument('--day', type=int, action='append', choices=sorted(GENERATORS),
+                        help='Day to benchmark (repeatable, default: all days)')
+    parser.add_argument('--size', type=float, default=1e5,
+                        help='Largest input size, e.g. 1e6 (default: 1e5)')
+    parser.add_argument('--steps', type=int, default=4,
+                        help='Number of sizes to measure (default: 4)')
+    parser.add_argument('--factor', type=float, default=4.0,
+                        help='Ratio between consecutive sizes (default: 4)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement, fastest is kept (default: 3)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for the input generators (default: 0)')
+    parser.add_argument('--output', help='Write the JSON report to this file')
+    args = parser.parse_args(argv)
+
+    days = args.day or sorted(GENERATORS)
+    report = {
+        'python': sys.version.split()[0],
+        'results': [
+            benchmark_day(day, int(args.size), steps=args.steps, factor=args.factor,
+                          repeat=args.repeat, seed=args.seed)
+            for day in days
+        ],
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Synthetic input generators for benchmarking each day's solvers.
+
+Every generator takes a target size and a seed and returns input lines in
+the same format as the day's input.txt, so output is deterministic for a
+given (size, seed) pair.
+"""
+
+import math
+import random
+
+
+def generate_day1(size: int, seed: int = 0) -> list[str]:
+    """
+    Generate a rotation log.
+
+    Args:
+        size: Number of rotation instructions
+        seed: Random seed
+
+    Returns:
+        List of lines like 'L68' or 'R4821'
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        # Mostly short turns with an occasional very long one
+        if rng.random() < 0.95:
+            distance = rng.randint(1, 999)
+        else:
+            distance = rng.randint(1000, 10 ** 9)
+        lines.append(f"{rng.choice('LR')}{distance}")
+    return lines
+
+
+def generate_day2(size: int, seed: int = 0) -> list[str]:
+    """
+    Generate a single line of wide ID ranges.
+
+    Args:
+        size: Number of ranges
+        seed: Random seed
+
+    Returns:
+        List with one line of comma-separated 'start-end' ranges
+    """
+    rng = random.Random(seed)
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, 10 ** 10)
+        end = start + rng.randint(0, 10 ** 9)
+        ranges.append(f"{start}-{end}")
+    return [','.join(ranges)]
+
+
+def generate_day3(size: int, seed: int = 0, bank_length: int = 100) -> list[str]:
+    """
+    Generate digit banks.
+
+    Args:
+        size: Total number of digits across all banks
+        seed: Random seed
+        bank_length: Number of digits per bank
+
+    Returns:
+        List of digit strings
+    """
+    rng = random.Random(seed)
+    bank_count = max(1, size // bank_length)
+    digits = '123456789'
+    return [''.join(rng.choices(digits, k=bank_length)) for _ in range(bank_count)]
+
+
+def generate_day4(size: int, seed: int = 0, density: float = 0.6) -> list[str]:
+    """
+    Generate a square '@'/'.' grid.
+
+    Args:
+        size: Approximate number of cells
+        seed: Random seed
+        density: Probability that a cell holds a roll
+
+    Returns:
+        List of grid rows
+    """
+    rng = random.Random(seed)
+    side = max(1, math.isqrt(size))
+    return [''.join('@' if rng.random() < density else '.' for _ in range(side))
+            for _ in range(side)]
+
+
+def generate_day5(size: int, seed: int = 0) -> list[str]:
+    """
+    Generate a ranges section and a seeds section.
+
+    Args:
+        size: Total number of ranges plus seeds, split evenly
+        seed: Random seed
+
+    Returns:
+        List of 'start-end' lines, a blank line, then seed lines
+    """
+    rng = random.Random(seed)
+    half = max(1, size // 2)
+    span = 10 ** 15
+    lines = []
+    for _ in range(half):
+        start = rng.randint(1, span)
+        lines.append(f"{start}-{start + rng.randint(0, span // half)}")
+    lines.append('')
+    lines.extend(str(rng.randint(1, span)) for _ in range(half))
+    return lines
+
+
+GENERATORS = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+}
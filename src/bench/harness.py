@@ -0,0 +1,112 @@
+"""Timing harness that measures how each day's solvers scale with input size."""
+
+import importlib
+import math
+import time
+
+from src.bench.generators import GENERATORS
+
+
+def load_solver_module(day: int):
+    """
+    Import the solution module for a day.
+
+    Args:
+        day: Day number
+
+    Returns:
+        The src.days.dayN.dayN module
+    """
+    return importlib.import_module(f"src.days.day{day}.day{day}")
+
+
+def time_call(func, argument, repeat: int) -> tuple[float, object]:
+    """
+    Time a function call, keeping the fastest of several runs.
+
+    Args:
+        func: Callable taking a single argument
+        argument: Argument passed to func
+        repeat: Number of runs
+
+    Returns:
+        tuple: (best_seconds, result) of the fastest run
+    """
+    best = math.inf
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(argument)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def scaling_exponent(sizes: list[int], seconds: list[float]) -> float | None:
+    """
+    Fit time ~ size^k with least squares in log-log space.
+
+    Args:
+        sizes: Input sizes
+        seconds: Measured times, aligned with sizes
+
+    Returns:
+        The exponent k, or None with fewer than two usable points
+    """
+    points = [(math.log(size), math.log(elapsed))
+              for size, elapsed in zip(sizes, seconds) if size > 0 and elapsed > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance
+
+
+def benchmark_day(day: int, max_size: int, steps: int = 4, factor: float = 4.0,
+                  repeat: int = 3, seed: int = 0) -> dict:
+    """
+    Benchmark both parts of a day over geometrically increasing sizes.
+
+    Args:
+        day: Day number
+        max_size: Largest input size
+        steps: Number of sizes to measure
+        factor: Ratio between consecutive sizes
+        repeat: Runs per measurement (fastest is kept)
+        seed: Seed for the input generator
+
+    Returns:
+        Dict with per-size timings, throughput and per-part scaling exponents
+    """
+    module = load_solver_module(day)
+    generator = GENERATORS[day]
+
+    sizes = sorted({max(1, int(max_size / factor ** step)) for step in range(steps)})
+    runs = []
+    timings = {'part1': [], 'part2': []}
+
+    for size in sizes:
+        lines = generator(size, seed)
+        run = {'size': size, 'lines': len(lines)}
+        for part in ('part1', 'part2'):
+            solver = getattr(module, f"solve_{part}")
+            seconds, result = time_call(solver, lines, repeat)
+            timings[part].append(seconds)
+            run[part] = {
+                'seconds': seconds,
+                'throughput': size / seconds if seconds else None,
+                'result': result,
+            }
+        runs.append(run)
+
+    return {
+        'day': day,
+        'seed': seed,
+        'repeat': repeat,
+        'runs': runs,
+        'scaling': {part: scaling_exponent(sizes, timings[part]) for part in timings},
+    }
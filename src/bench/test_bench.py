@@ -0,0 +1,20 @@
+"""Tests for the benchmark harness."""
+
+import pytest
+from src.bench.generators import GENERATORS
+from src.bench.harness import benchmark_day, scaling_exponent
+
+
+@pytest.mark.parametrize('day', sorted(GENERATORS))
+def test_benchmark_day_runs(day):
+    """Test that every day benchmarks on small synthetic inputs."""
+    report = benchmark_day(day, 400, steps=2, repeat=1)
+    assert [run['size'] for run in report['runs']] == [100, 400]
+    assert set(report['scaling']) == {'part1', 'part2'}
+
+
+def test_scaling_exponent():
+    """Test the log-log fit on exact power laws."""
+    assert scaling_exponent([10, 100, 1000], [1.0, 10.0, 100.0]) == pytest.approx(1.0)
+    assert scaling_exponent([10, 100], [1.0, 100.0]) == pytest.approx(2.0)
+    assert scaling_exponent([10], [1.0]) is None
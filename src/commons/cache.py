@@ -0,0 +1,239 @@
+"""Persistent parse and result cache for Advent of Code 2025 solutions.
+
+Entries live in a local SQLite file and are keyed by a BLAKE2 hash of the
+input bytes, the solver module's version and the kind of entry (parsed
+model or a part's result), so a changed input or solver never hits stale
+data. The store is size-bounded with least-recently-used eviction.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from typing import Callable
+
+CACHE_DIR_ENV = 'AOC_CACHE_DIR'
+DISABLE_CACHE_ENV = 'AOC_NO_CACHE'
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aoc2025')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def hash_file(filename: str) -> str:
+    """
+    Compute the BLAKE2b digest of a file's bytes.
+
+    Args:
+        filename: Path to the file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(filename, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def module_version(module) -> str:
+    """
+    Return a version string for a solver module.
+
+    Uses the module's __version__ when it defines one. Otherwise it is a
+    BLAKE2b digest of every source file in the module's package (backends
+    such as vectorized.py included) and of the shared src/commons modules,
+    so a change to any code a result can depend on invalidates its entries.
+
+    Args:
+        module: Solver module
+
+    Returns:
+        Version string
+    """
+    version = getattr(module, '__version__', None)
+    if version is not None:
+        return str(version)
+
+    package_dir = os.path.dirname(os.path.abspath(module.__file__))
+    commons_dir = os.path.dirname(os.path.abspath(__file__))
+    sources = _source_files(package_dir) + _source_files(commons_dir)
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sources:
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            digest.update(hashlib.blake2b(f.read(), digest_size=16).digest())
+    return digest.hexdigest()
+
+
+def _source_files(directory: str) -> list[str]:
+    """Return the non-test Python sources of a package directory, sorted."""
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.endswith('.py') and not name.startswith('test_'))
+
+
+def cache_disabled_by_env() -> bool:
+    """Return True if the AOC_NO_CACHE environment variable opts out of caching."""
+    value = os.environ.get(DISABLE_CACHE_ENV, '').lower()
+    return value not in ('', '0', 'false', 'no')
+
+
+class ResultCache:
+    """Size-bounded LRU store of pickled values in a SQLite file."""
+
+    def __init__(self, path: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 enabled: bool | None = None):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite file path (default: $AOC_CACHE_DIR or ~/.cache/aoc2025)
+            max_bytes: Upper bound on the total size of stored values
+            enabled: Force caching on or off; None defers to AOC_NO_CACHE
+        """
+        self.enabled = not cache_disabled_by_env() if enabled is None else enabled
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+
+        if not self.enabled:
+            return
+
+        if path is None:
+            directory = os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, 'cache.sqlite3')
+
+        self.path = path
+        self._connection = sqlite3.connect(path, timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+            'size INTEGER NOT NULL, last_access REAL NOT NULL)'
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> 'ResultCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def make_key(input_hash: str, version: str, kind: str) -> str:
+        """
+        Build a cache key.
+
+        Args:
+            input_hash: Digest of the input bytes from hash_file
+            version: Solver version from module_version
+            kind: Entry kind, e.g. 'parsed' or 'part1'
+
+        Returns:
+            Cache key string
+        """
+        return f"{input_hash}:{version}:{kind}"
+
+    def get(self, key: str) -> tuple[bool, object]:
+        """
+        Look up a value and refresh its recency.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            tuple: (found, value) where value is None when not found
+        """
+        if self._connection is None:
+            return False, None
+
+        row = self._connection.execute(
+            'SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return False, None
+
+        self._connection.execute(
+            'UPDATE entries SET last_access = ? WHERE key = ?', (time.time(), key))
+        self._connection.commit()
+        self.hits += 1
+        return True, pickle.loads(row[0])
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Store a value, evicting least recently used entries beyond max_bytes.
+
+        Values larger than max_bytes on their own are not stored.
+
+        Args:
+            key: Cache key
+            value: Picklable value
+        """
+        if self._connection is None:
+            return
+
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+
+        self._connection.execute(
+            'INSERT OR REPLACE INTO entries (key, value, size, last_access) '
+            'VALUES (?, ?, ?, ?)',
+            (key, blob, len(blob), time.time()))
+        self._evict()
+        self._connection.commit()
+
+    def get_or_compute(self, key: str, compute: Callable[[], object]) -> object:
+        """
+        Return the cached value for a key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        found, value = self.get(key)
+        if not found:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss counters and store size for monitoring.
+
+        Returns:
+            Dict with hits, misses, entries and bytes
+        """
+        entries, total = 0, 0
+        if self._connection is not None:
+            entries, total = self._connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        return {'hits': self.hits, 'misses': self.misses,
+                'entries': entries, 'bytes': total}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the store fits in max_bytes."""
+        (total,) = self._connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()
+        if total <= self.max_bytes:
+            return
+
+        rows = self._connection.execute(
+            'SELECT key, size FROM entries ORDER BY last_access').fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+            total -= size
@@ -0,0 +1,185 @@
+"""Checkpoint files for resuming long-running solvers.
+
+A checkpoint holds a list of integers (of any size) and an optional binary
+blob, tagged with the solver kind and a fingerprint of the input so that a
+checkpoint is never resumed against different data. Files are written to a
+temporary name and renamed into place, so a crash mid-write leaves the
+previous checkpoint intact.
+
+Layout (all integers big-endian):
+    magic 'AOCK' | version (1 byte) | kind length (1) | kind
+    | fingerprint length (1) | fingerprint | field count (2)
+    | per field: byte length (2) + signed integer bytes
+    | blob length (8) | blob | CRC32 of everything before (4)
+"""
+
+import os
+import struct
+import time
+import zlib
+
+MAGIC = b'AOCK'
+FORMAT_VERSION = 1
+DEFAULT_INTERVAL = 60.0
+
+
+class CheckpointError(Exception):
+    """Raised when a checkpoint file is corrupt or belongs to other input."""
+
+
+def encode_checkpoint(kind: str, fingerprint: bytes, fields: list[int],
+                      blob: bytes = b'') -> bytes:
+    """
+    Serialize checkpoint state.
+
+    Args:
+        kind: Solver identifier, e.g. 'day4.part2'
+        fingerprint: Digest identifying the input
+        fields: Integers describing the solver state
+        blob: Optional bulk state such as a packed grid
+
+    Returns:
+        Encoded checkpoint bytes
+    """
+    kind_bytes = kind.encode('ascii')
+    parts = [MAGIC, struct.pack('>BB', FORMAT_VERSION, len(kind_bytes)), kind_bytes,
+             struct.pack('>B', len(fingerprint)), fingerprint,
+             struct.pack('>H', len(fields))]
+    for value in fields:
+        length = (value.bit_length() + 8) // 8
+        parts.append(struct.pack('>H', length))
+        parts.append(value.to_bytes(length, 'big', signed=True))
+    parts.append(struct.pack('>Q', len(blob)))
+    parts.append(blob)
+
+    payload = b''.join(parts)
+    return payload + struct.pack('>I', zlib.crc32(payload))
+
+
+def decode_checkpoint(data: bytes, kind: str,
+                      fingerprint: bytes) -> tuple[list[int], bytes]:
+    """
+    Deserialize checkpoint state and check that it belongs to this run.
+
+    Args:
+        data: Encoded checkpoint bytes
+        kind: Expected solver identifier
+        fingerprint: Expected input digest
+
+    Returns:
+        tuple: (fields, blob)
+
+    Raises:
+        CheckpointError: If the data is corrupt or for another kind or input
+    """
+    if len(data) < 4 or struct.unpack('>I', data[-4:])[0] != zlib.crc32(data[:-4]):
+        raise CheckpointError("Checkpoint is corrupt")
+    if not data.startswith(MAGIC):
+        raise CheckpointError("Not a checkpoint file")
+
+    offset = len(MAGIC)
+    version, kind_length = struct.unpack_from('>BB', data, offset)
+    offset += 2
+    if version != FORMAT_VERSION:
+        raise CheckpointError(f"Unsupported checkpoint version: {version}")
+    stored_kind = data[offset:offset + kind_length].decode('ascii')
+    offset += kind_length
+    (fingerprint_length,) = struct.unpack_from('>B', data, offset)
+    offset += 1
+    stored_fingerprint = data[offset:offset + fingerprint_length]
+    offset += fingerprint_length
+
+    if stored_kind != kind or stored_fingerprint != fingerprint:
+        raise CheckpointError(f"Checkpoint is for a different run ({stored_kind})")
+
+    (field_count,) = struct.unpack_from('>H', data, offset)
+    offset += 2
+    fields = []
+    for _ in range(field_count):
+        (length,) = struct.unpack_from('>H', data, offset)
+        offset += 2
+        fields.append(int.from_bytes(data[offset:offset + length], 'big', signed=True))
+        offset += length
+
+    (blob_length,) = struct.unpack_from('>Q', data, offset)
+    offset += 8
+    return fields, data[offset:offset + blob_length]
+
+
+class Checkpointer:
+    """Periodically saves solver state to a file and restores it on resume."""
+
+    def __init__(self, path: str, kind: str, fingerprint: bytes,
+                 interval: float = DEFAULT_INTERVAL, resume: bool = False):
+        """
+        Set up checkpointing for one solver run.
+
+        Args:
+            path: Checkpoint file path
+            kind: Solver identifier stored in the file
+            fingerprint: Digest identifying the input
+            interval: Minimum seconds between automatic saves
+            resume: Whether load() should read an existing checkpoint
+        """
+        self.path = path
+        self.kind = kind
+        self.fingerprint = fingerprint
+        self.interval = interval
+        self.resume = resume
+        self._last_save = time.monotonic()
+
+    def load(self) -> tuple[list[int], bytes] | None:
+        """
+        Read the saved state if resuming and a checkpoint exists.
+
+        Returns:
+            tuple: (fields, blob), or None to start from scratch
+
+        Raises:
+            CheckpointError: If the file is corrupt or for another run
+        """
+        if not self.resume or not os.path.exists(self.path):
+            return None
+        with open(self.path, 'rb') as f:
+            return decode_checkpoint(f.read(), self.kind, self.fingerprint)
+
+    def save(self, fields: list[int], blob: bytes = b'') -> None:
+        """
+        Atomically write the current state.
+
+        Args:
+            fields: Integers describing the solver state
+            blob: Optional bulk state
+        """
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(encode_checkpoint(self.kind, self.fingerprint, fields, blob))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._last_save = time.monotonic()
+
+    def maybe_save(self, fields: list[int], blob: bytes | None = None) -> bool:
+        """
+        Save the state if the interval has elapsed since the last save.
+
+        Args:
+            fields: Integers describing the solver state
+            blob: Optional bulk state
+
+        Returns:
+            True if a checkpoint was written
+        """
+        if time.monotonic() - self._last_save < self.interval:
+            return False
+        self.save(fields, blob or b'')
+        return True
+
+    def due(self) -> bool:
+        """Return True if the interval has elapsed since the last save."""
+        return time.monotonic() - self._last_save >= self.interval
+
+    def clear(self) -> None:
+        """Remove the checkpoint file once the run has finished."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
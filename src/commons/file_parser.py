@@ -1,27 +1,166 @@
 """File parsing utilities for Advent of Code 2025 solutions."""
 
+import contextlib
+import os
+from contextvars import ContextVar
+from typing import Callable, Iterable, Iterator, TextIO, TypeVar
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+T = TypeVar('T')
+
+
+class InputFileError(Exception):
+    """Raised when an input file cannot be opened or read."""
+
+    def __init__(self, filename: str, message: str):
+        super().__init__(message)
+        self.filename = filename
+
+
+class InputFileNotFoundError(InputFileError):
+    """Raised when an input file does not exist."""
+
+
+@contextlib.contextmanager
+def input_file_errors(filename: str,
+                      errors: tuple[type, ...] = (OSError,)) -> Iterator[None]:
+    """
+    Report failures while accessing an input file as InputFileError.
+
+    Usage:
+        with input_file_errors(filename):
+            with open(filename, 'rb') as f:
+                data = f.read()
+
+    Args:
+        filename: Path to the input file being accessed
+        errors: Exception types that mean the file could not be read
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If one of errors is raised inside the block
+    """
+    try:
+        yield
+    except FileNotFoundError as e:
+        raise InputFileNotFoundError(filename, f"File '{filename}' not found") from e
+    except errors as e:
+        raise InputFileError(filename, f"Could not read file '{filename}': {e}") from e
+
+
+def iter_input_lines(filename: str,
+                     buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[str]:
+    """
+    Lazily yield lines of an input file without newlines.
+
+    The file is opened immediately, so a missing file is reported at call
+    time, but lines are only read as the iterator is consumed. Memory use
+    stays bounded by the buffer size regardless of file size.
+
+    Args:
+        filename: Path to the input file
+        buffer_size: Size in bytes of the underlying read buffer
+
+    Returns:
+        Iterator over lines without trailing newlines
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be opened or read
+    """
+    with input_file_errors(filename):
+        f = open(filename, 'r', buffering=buffer_size)
+
+    return _iter_open_file(f, filename)
+
+
+def _iter_open_file(f: TextIO, filename: str) -> Iterator[str]:
+    """Yield stripped lines from an open file and close it when exhausted."""
+    with f, input_file_errors(filename, (OSError, UnicodeDecodeError)):
+        for line in f:
+            yield line.rstrip('\n\r')
+
 
 def parse_input_file(filename: str) -> list[str]:
     """
     Parse input file and return list of lines without newlines.
-    
+
     Args:
         filename: Path to the input file
-        
+
     Returns:
         List of strings, each representing a line without trailing newlines
-        
+
     Raises:
         SystemExit: If file not found or error occurs
     """
     import sys
-    
+
     try:
-        with open(filename, 'r') as f:
-            return [line.rstrip('\n\r') for line in f]
-    except FileNotFoundError:
-        print(f"Error: File '{filename}' not found")
+        return list(iter_input_lines(filename))
+    except InputFileError as e:
+        print(f"Error: {e}")
         sys.exit(1)
-    except Exception as e:
-        print(f"Error reading file '{filename}': {e}")
-        sys.exit(1)
\ No newline at end of file
+
+
+# Parsed models of the innermost active parse_scope(), or None outside one
+_parsed_models: ContextVar[dict | None] = ContextVar('parsed_models', default=None)
+
+
+@contextlib.contextmanager
+def parse_scope() -> Iterator[None]:
+    """
+    Share parsed models between load_parsed_input calls inside a with block.
+
+    The models are dropped when the block exits, so a long-lived process
+    (e.g. a runner pool worker) keeps nothing alive between jobs. Nested
+    scopes reuse the outermost one.
+
+    Usage:
+        with parse_scope():
+            solve_part1_parsed(load_parsed_input(filename, parse_input))
+            solve_part2_parsed(load_parsed_input(filename, parse_input))
+    """
+    if _parsed_models.get() is not None:
+        yield
+        return
+
+    token = _parsed_models.set({})
+    try:
+        yield
+    finally:
+        _parsed_models.reset(token)
+
+
+def load_parsed_input(filename: str, parser: Callable[[Iterable[str]], T]) -> T:
+    """
+    Parse an input file, reusing the result within the current parse_scope().
+
+    Inside a scope, results are cached per (path, mtime, size, parser), so
+    part 1 and part 2 of the same file share one parse; the cached object is
+    shared between callers and must be treated as read-only. Outside a
+    scope every call parses afresh.
+
+    Args:
+        filename: Path to the input file
+        parser: Day-specific function turning input lines into a parsed model
+
+    Returns:
+        The parser's result for the file's current contents
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be read
+    """
+    with input_file_errors(filename):
+        stat = os.stat(filename)
+
+    models = _parsed_models.get()
+    if models is None:
+        return parser(iter_input_lines(filename))
+
+    key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size, parser)
+    if key not in models:
+        models[key] = parser(iter_input_lines(filename))
+    return models[key]
@@ -0,0 +1,131 @@
+"""Memory-mapped grid loading for Advent of Code 2025 solutions."""
+
+import mmap
+from typing import Iterator
+
+from src.commons.file_parser import input_file_errors
+
+
+class MappedGrid:
+    """
+    Zero-copy 2D view over a memory-mapped grid file.
+
+    Rows are exposed as memoryview slices of the mapping, one byte per cell,
+    so loading costs no per-cell Python objects. Row boundaries are derived
+    from the first line ending ('\\n' or '\\r\\n'), and every row is assumed
+    to have the same width.
+    """
+
+    def __init__(self, filename: str, copy_on_write: bool = False):
+        """
+        Map a grid file into memory.
+
+        Args:
+            filename: Path to the grid file
+            copy_on_write: If True, rows are writable and writes stay private
+                           to this process instead of reaching the file
+
+        Raises:
+            InputFileNotFoundError: If the file does not exist
+            InputFileError: If the file cannot be opened or mapped
+        """
+        self._map = None
+        with input_file_errors(filename, (OSError, ValueError)):
+            with open(filename, 'rb') as f:
+                size = f.seek(0, 2)
+                if size:
+                    access = mmap.ACCESS_COPY if copy_on_write else mmap.ACCESS_READ
+                    self._map = mmap.mmap(f.fileno(), 0, access=access)
+
+        self._view = memoryview(self._map if self._map is not None else b'')
+        if not copy_on_write:
+            self._view = self._view.toreadonly()
+
+        newline = self._map.find(b'\n') if self._map is not None else -1
+        if newline < 0:
+            # Single row without a line ending (or empty file)
+            self.cols = len(self._view)
+            self.stride = self.cols
+            self.rows = 1 if self.cols else 0
+            return
+
+        crlf = newline and self._map[newline - 1] == ord('\r')
+        self.cols = newline - 1 if crlf else newline
+        self.stride = newline + 1
+        # The last row may lack a line ending; blank trailing lines are ignored
+        end = len(self._view)
+        while end and self._map[end - 1] in b'\r\n':
+            end -= 1
+        full_rows, remainder = divmod(end, self.stride)
+        self.rows = full_rows + (1 if remainder >= self.cols and self.cols else 0)
+
+    def __enter__(self) -> 'MappedGrid':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.rows
+
+    def __getitem__(self, row: int) -> memoryview:
+        """Return a row as a memoryview of cell bytes."""
+        return self.row(row)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Iterate over the rows."""
+        for row in range(self.rows):
+            yield self.row(row)
+
+    @property
+    def buffer(self) -> memoryview:
+        """Underlying byte buffer, including line endings between rows."""
+        return self._view
+
+    def row(self, row: int) -> memoryview:
+        """
+        Return a row without its line ending.
+
+        Args:
+            row: Row index, negative values count from the end
+
+        Returns:
+            memoryview over the row's cell bytes
+
+        Raises:
+            IndexError: If the row is out of range
+        """
+        if row < 0:
+            row += self.rows
+        if not 0 <= row < self.rows:
+            raise IndexError(f"Row {row} out of range")
+        offset = row * self.stride
+        return self._view[offset:offset + self.cols]
+
+    def cell(self, row: int, col: int) -> int:
+        """
+        Return the byte value of a single cell.
+
+        Args:
+            row: Row index
+            col: Column index
+
+        Returns:
+            Cell byte value (e.g. ord('@'))
+        """
+        if not 0 <= col < self.cols:
+            raise IndexError(f"Column {col} out of range")
+        return self.row(row)[col]
+
+    def close(self) -> None:
+        """
+        Release the view and unmap the file.
+
+        Raises:
+            BufferError: If row memoryviews handed out earlier are still alive
+        """
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
@@ -0,0 +1,206 @@
+"""Lightweight timing, counting and profiling hooks for solvers.
+
+Phases are measured with timed(), which works both as a decorator and as a
+context manager, and event totals are recorded with count(). Everything is
+off unless enabled with AOC_PROFILE=1 (or enable(), e.g. from the runner's
+--profile flag); when off, each hook costs one flag check. When on, every
+phase records wall time, call count and tracemalloc peak memory, and
+setting AOC_PROFILE_DIR also dumps a cProfile stats file per phase call.
+"""
+
+import atexit
+import contextlib
+import cProfile
+import functools
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Iterator
+
+PROFILE_ENV = 'AOC_PROFILE'
+PROFILE_DIR_ENV = 'AOC_PROFILE_DIR'
+
+_enabled = False
+_profile_dir = None
+_phases = {}
+_counters = {}
+_dump_sequence = itertools.count()
+# Phases currently entered, innermost last
+_active = []
+
+
+def enable(enabled: bool = True, profile_dir: str | None = None) -> None:
+    """
+    Turn instrumentation on or off for this process.
+
+    Args:
+        enabled: True to start recording, False to stop
+        profile_dir: Directory for per-phase cProfile dumps (None: no dumps)
+    """
+    global _enabled, _profile_dir
+    _enabled = enabled
+    _profile_dir = profile_dir
+    if enabled and profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def profiling(profile_dir: str | None = None) -> Iterator[None]:
+    """
+    Turn instrumentation on inside a with block only.
+
+    The previous enabled state and dump directory are restored on exit,
+    and tracemalloc is stopped again unless it was already tracing.
+
+    Args:
+        profile_dir: Directory for per-phase cProfile dumps (None: no dumps)
+    """
+    global _enabled, _profile_dir
+    previous = (_enabled, _profile_dir)
+    was_tracing = tracemalloc.is_tracing()
+    enable(profile_dir=profile_dir)
+    try:
+        yield
+    finally:
+        _enabled, _profile_dir = previous
+        if not was_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def is_enabled() -> bool:
+    """Return True if instrumentation is recording."""
+    return _enabled
+
+
+def reset() -> None:
+    """Clear all recorded phases and counters."""
+    _phases.clear()
+    _counters.clear()
+
+
+def count(name: str, amount: int = 1) -> None:
+    """
+    Add to a named counter.
+
+    Args:
+        name: Counter name, e.g. 'day2.ranges'
+        amount: Value to add
+    """
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def report() -> dict:
+    """
+    Return everything recorded so far.
+
+    Returns:
+        Dict with 'phases' (seconds, calls and peak_bytes per phase name)
+        and 'counters'
+    """
+    return {
+        'phases': {name: dict(stats) for name, stats in _phases.items()},
+        'counters': dict(_counters),
+    }
+
+
+def timed(name: str) -> '_Phase':
+    """
+    Measure a named phase, as a decorator or a context manager.
+
+    Usage:
+        @timed('day4.parse')
+        def parse_input(...): ...
+
+        with timed('day4.rounds'):
+            ...
+
+    Args:
+        name: Phase name, e.g. 'day4.part2'
+
+    Returns:
+        Object usable as a decorator or in a with statement
+    """
+    return _Phase(name)
+
+
+class _Phase:
+    """Decorator and context manager behind timed()."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = None
+        self._profiler = None
+        # Traced memory on entry and the highest value seen since
+        self._base = None
+        self._high = 0
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Phase(self.name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def __enter__(self) -> '_Phase':
+        if _enabled:
+            if tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                # Resetting the peak below would lose the enclosing phase's high so far
+                if _active and _active[-1]._base is not None:
+                    _active[-1]._high = max(_active[-1]._high, peak)
+                tracemalloc.reset_peak()
+                self._base = self._high = current
+            _active.append(self)
+            if _profile_dir:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._start is None:
+            return
+
+        elapsed = time.perf_counter() - self._start
+        self._start = None
+        if self in _active:
+            _active.remove(self)
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            filename = f"{self.name}-{os.getpid()}-{next(_dump_sequence)}.pstats"
+            self._profiler.dump_stats(os.path.join(_profile_dir, filename))
+            self._profiler = None
+
+        stats = _phases.setdefault(self.name,
+                                   {'seconds': 0.0, 'calls': 0, 'peak_bytes': 0})
+        stats['seconds'] += elapsed
+        stats['calls'] += 1
+        if self._base is not None and tracemalloc.is_tracing():
+            high = max(self._high, tracemalloc.get_traced_memory()[1])
+            if _active and _active[-1]._base is not None:
+                _active[-1]._high = max(_active[-1]._high, high)
+            # Only memory allocated since the phase began counts towards its peak
+            stats['peak_bytes'] = max(stats['peak_bytes'], high - self._base)
+            self._base = None
+
+
+def _emit_report() -> None:
+    """Print the recorded report to stderr as JSON."""
+    if _phases or _counters:
+        print(json.dumps({'instrumentation': report()}), file=sys.stderr)
+
+
+if os.environ.get(PROFILE_ENV, '').lower() not in ('', '0', 'false', 'no'):
+    enable(profile_dir=os.environ.get(PROFILE_DIR_ENV) or None)
+    atexit.register(_emit_report)
@@ -0,0 +1,37 @@
+"""Compact integer sequences for parsed puzzle models."""
+
+from array import array
+from typing import Iterable
+
+# Largest magnitude stored in a signed 64-bit array
+INT64_LIMIT = (1 << 63) - 1
+
+
+def pack_ints(values: Iterable[int],
+              limit: int = INT64_LIMIT) -> array | tuple[int, ...]:
+    """
+    Store integers in an array('q'), or in a tuple when one does not fit.
+
+    Puzzle inputs are usually small numbers, which an array holds at 8
+    bytes each, but Python ints are unbounded and a single large value
+    must not make parsing fail.
+
+    Args:
+        values: Integers to store, consumed once
+        limit: Largest magnitude allowed in the array; callers doing
+               int64 arithmetic on the values can pass a smaller bound
+
+    Returns:
+        array('q') of the values if every magnitude is within limit,
+        otherwise a tuple of Python ints
+    """
+    packed = array('q')
+    values = iter(values)
+
+    for value in values:
+        if -limit <= value <= limit:
+            packed.append(value)
+        else:
+            return (*packed, value, *values)
+
+    return packed
@@ -0,0 +1,369 @@
+"""Interval index utilities for Advent of Code 2025 solutions.
+
+Provides sorted, merged views over inclusive integer ranges so that point
+membership and coverage-depth queries cost O(log n) via binary search, and
+a mutable store for long-lived processes that add and remove ranges online.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable
+
+# Target number of values per block of a BlockedSortedList
+BLOCK_SIZE = 512
+
+
+def merge_intervals(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Merge overlapping or touching inclusive ranges.
+
+    Args:
+        ranges: Iterable of (start, end) inclusive integer ranges
+
+    Returns:
+        Sorted list of disjoint (start, end) ranges covering the same integers
+    """
+    merged = []
+
+    for start, end in sorted(ranges):
+        # Ranges like 3-5 and 6-8 cover a contiguous run of integers
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+class IntervalIndex:
+    """Sorted and merged view of inclusive ranges for "is covered" queries."""
+
+    def __init__(self, ranges: Iterable[tuple[int, int]]):
+        """
+        Build the index from inclusive ranges.
+
+        Args:
+            ranges: Iterable of (start, end) inclusive integer ranges
+        """
+        merged = merge_intervals(ranges)
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+
+    def __len__(self) -> int:
+        """Return the number of disjoint merged ranges."""
+        return len(self._starts)
+
+    def __contains__(self, point: int) -> bool:
+        """Return True if point lies inside any range."""
+        return self.contains(point)
+
+    def contains(self, point: int) -> bool:
+        """
+        Check whether a point is covered by at least one range.
+
+        Args:
+            point: Integer to look up
+
+        Returns:
+            True if some range contains the point, False otherwise
+        """
+        index = bisect_right(self._starts, point) - 1
+        return index >= 0 and point <= self._ends[index]
+
+
+class CoverageIndex:
+    """Sweep-line coverage-depth array for "covered by >= k ranges" queries."""
+
+    def __init__(self, ranges: Iterable[tuple[int, int]]):
+        """
+        Build the depth array from inclusive ranges.
+
+        Each range contributes +1 at its start and -1 just past its end.
+        After sorting the events, depth[i] is the number of ranges covering
+        every point in [boundaries[i], boundaries[i + 1]).
+
+        Args:
+            ranges: Iterable of (start, end) inclusive integer ranges
+        """
+        deltas = {}
+        for start, end in ranges:
+            deltas[start] = deltas.get(start, 0) + 1
+            deltas[end + 1] = deltas.get(end + 1, 0) - 1
+
+        self._boundaries = []
+        self._depths = []
+        depth = 0
+
+        for boundary in sorted(deltas):
+            depth += deltas[boundary]
+            self._boundaries.append(boundary)
+            self._depths.append(depth)
+
+    def depth(self, point: int) -> int:
+        """
+        Count how many ranges cover a point.
+
+        Args:
+            point: Integer to look up
+
+        Returns:
+            Number of ranges containing the point
+        """
+        index = bisect_right(self._boundaries, point) - 1
+        return self._depths[index] if index >= 0 else 0
+
+    def covered_at_least(self, point: int, k: int) -> bool:
+        """
+        Check whether a point is covered by at least k ranges.
+
+        Args:
+            point: Integer to look up
+            k: Minimum number of covering ranges
+
+        Returns:
+            True if the point lies inside k or more ranges
+        """
+        return self.depth(point) >= k
+
+
+class BlockedSortedList:
+    """
+    Sorted multiset of integers split into blocks of bounded size.
+
+    Blocks hold at most 2 * BLOCK_SIZE values, so an insert or delete moves
+    a bounded number of elements; the block is found by bisecting the
+    block maxima, and a Fenwick tree over block lengths turns a position
+    inside a block into a global rank in O(log n). Splitting a full block
+    rebuilds the tree, which happens once per BLOCK_SIZE inserts.
+    """
+
+    def __init__(self, values: Iterable[int] = ()):
+        """
+        Build the list from values in any order.
+
+        Args:
+            values: Initial integers, sorted once
+        """
+        ordered = sorted(values)
+        self._blocks = [ordered[i:i + BLOCK_SIZE]
+                        for i in range(0, len(ordered), BLOCK_SIZE)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._length = len(ordered)
+        self._rebuild_index()
+
+    def __len__(self) -> int:
+        """Return the number of values, counting duplicates."""
+        return self._length
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the Fenwick tree of block lengths."""
+        tree = [0] * (len(self._blocks) + 1)
+        for index, block in enumerate(self._blocks, start=1):
+            tree[index] += len(block)
+            parent = index + (index & -index)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+        self._tree = tree
+
+    def _update_index(self, block_index: int, delta: int) -> None:
+        """Add delta to one block's length in the Fenwick tree."""
+        index = block_index + 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def _values_before(self, block_index: int) -> int:
+        """Count the values in blocks before block_index."""
+        total = 0
+        index = block_index
+        while index:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def add(self, value: int) -> None:
+        """
+        Insert a value.
+
+        Args:
+            value: Integer to insert
+        """
+        self._length += 1
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+            self._rebuild_index()
+            return
+
+        # Values above every maximum go to the last block
+        block_index = min(bisect_left(self._maxes, value), len(self._blocks) - 1)
+        block = self._blocks[block_index]
+        insort(block, value)
+        self._maxes[block_index] = block[-1]
+        self._update_index(block_index, 1)
+
+        if len(block) > 2 * BLOCK_SIZE:
+            tail = block[BLOCK_SIZE:]
+            del block[BLOCK_SIZE:]
+            self._blocks.insert(block_index + 1, tail)
+            self._maxes[block_index] = block[-1]
+            self._maxes.insert(block_index + 1, tail[-1])
+            self._rebuild_index()
+
+    def remove(self, value: int) -> None:
+        """
+        Remove one occurrence of a value.
+
+        Args:
+            value: Integer to remove
+
+        Raises:
+            ValueError: If the value is not present
+        """
+        block_index = bisect_left(self._maxes, value)
+        if block_index < len(self._blocks):
+            block = self._blocks[block_index]
+            position = bisect_left(block, value)
+            if block[position] == value:
+                del block[position]
+                self._length -= 1
+                if block:
+                    self._maxes[block_index] = block[-1]
+                    self._update_index(block_index, -1)
+                else:
+                    del self._blocks[block_index]
+                    del self._maxes[block_index]
+                    self._rebuild_index()
+                return
+        raise ValueError(f"{value} is not in the list")
+
+    def count_less(self, value: int) -> int:
+        """Count values strictly below value."""
+        block_index = bisect_left(self._maxes, value)
+        if block_index == len(self._blocks):
+            return self._length
+        block = self._blocks[block_index]
+        return self._values_before(block_index) + bisect_left(block, value)
+
+    def count_at_most(self, value: int) -> int:
+        """Count values less than or equal to value."""
+        block_index = bisect_right(self._maxes, value)
+        if block_index == len(self._blocks):
+            return self._length
+        block = self._blocks[block_index]
+        return self._values_before(block_index) + bisect_right(block, value)
+
+
+class IntervalStore:
+    """Mutable multiset of inclusive ranges answering coverage queries online."""
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()):
+        """
+        Create a store, optionally holding some ranges already.
+
+        Args:
+            ranges: Iterable of (start, end) inclusive integer ranges
+
+        Raises:
+            ValueError: If a range has start greater than end
+        """
+        # Range starts and ends kept as two independently sorted multisets,
+        # plus a count of each exact range so removals can be validated
+        self._counts = {}
+        for start, end in ranges:
+            if start > end:
+                raise ValueError(f"Start cannot be greater than end: {start}-{end}")
+            self._counts[start, end] = self._counts.get((start, end), 0) + 1
+
+        stored = [key for key, copies in self._counts.items() for _ in range(copies)]
+        self._starts = BlockedSortedList(start for start, _ in stored)
+        self._ends = BlockedSortedList(end for _, end in stored)
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int]]) -> 'IntervalStore':
+        """
+        Bulk-load a store, sorting once instead of inserting one range at a time.
+
+        Args:
+            ranges: Iterable of (start, end) inclusive integer ranges
+
+        Returns:
+            A store holding every range
+
+        Raises:
+            ValueError: If a range has start greater than end
+        """
+        return cls(ranges)
+
+    def __len__(self) -> int:
+        """Return the number of stored ranges, counting duplicates."""
+        return len(self._starts)
+
+    def __contains__(self, point: int) -> bool:
+        """Return True if point lies inside any stored range."""
+        return self.query(point)
+
+    def add_range(self, start: int, end: int) -> None:
+        """
+        Add an inclusive range in O(log n) amortized time.
+
+        Args:
+            start: First covered integer
+            end: Last covered integer
+
+        Raises:
+            ValueError: If start is greater than end
+        """
+        if start > end:
+            raise ValueError(f"Start cannot be greater than end: {start}-{end}")
+        self._starts.add(start)
+        self._ends.add(end)
+        self._counts[start, end] = self._counts.get((start, end), 0) + 1
+
+    def remove_range(self, start: int, end: int) -> None:
+        """
+        Remove one added copy of an inclusive range in O(log n) amortized time.
+
+        Args:
+            start: First covered integer
+            end: Last covered integer
+
+        Raises:
+            ValueError: If the range is not in the store
+        """
+        copies = self._counts.get((start, end), 0)
+        if not copies:
+            raise ValueError(f"Range not in store: {start}-{end}")
+        if copies == 1:
+            del self._counts[start, end]
+        else:
+            self._counts[start, end] = copies - 1
+        self._starts.remove(start)
+        self._ends.remove(end)
+
+    def coverage(self, point: int) -> int:
+        """
+        Count how many stored ranges cover a point.
+
+        Ranges covering the point are those starting at or before it minus
+        those that already ended before it.
+
+        Args:
+            point: Integer to look up
+
+        Returns:
+            Number of ranges containing the point
+        """
+        return self._starts.count_at_most(point) - self._ends.count_less(point)
+
+    def query(self, point: int) -> bool:
+        """
+        Check whether a point is covered by at least one stored range.
+
+        Args:
+            point: Integer to look up
+
+        Returns:
+            True if some range contains the point, False otherwise
+        """
+        return self.coverage(point) > 0
@@ -0,0 +1,42 @@
+"""Tests for the persistent result cache."""
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    """Test LRU eviction and hit/miss counters of the result cache."""
+    from src.commons.cache import ResultCache
+    path = str(tmp_path / 'cache.sqlite3')
+    with ResultCache(path, max_bytes=250, enabled=True) as cache:
+        cache.put('a', b'x' * 100)
+        cache.put('b', b'x' * 100)
+        assert cache.get('a')[0]
+        cache.put('c', b'x' * 100)
+        assert not cache.get('b')[0]
+        assert cache.get('c')[0]
+        assert cache.stats()['hits'] == 2
+        assert cache.stats()['misses'] == 1
+
+
+def test_module_version_covers_backends_and_commons(tmp_path, monkeypatch):
+    """Test that editing a backend or commons module changes the solver version."""
+    import types
+    from src.commons import cache
+    package = tmp_path / 'day9'
+    commons = tmp_path / 'commons'
+    package.mkdir()
+    commons.mkdir()
+    (package / 'day9.py').write_text('x = 1\n')
+    (package / 'vectorized.py').write_text('y = 1\n')
+    (package / 'test_day9.py').write_text('z = 1\n')
+    (commons / 'cache.py').write_text('w = 1\n')
+    monkeypatch.setattr(cache, '__file__', str(commons / 'cache.py'))
+    module = types.SimpleNamespace(__file__=str(package / 'day9.py'))
+
+    versions = [cache.module_version(module)]
+    (package / 'test_day9.py').write_text('z = 2\n')
+    versions.append(cache.module_version(module))
+    (package / 'vectorized.py').write_text('y = 2\n')
+    versions.append(cache.module_version(module))
+    (commons / 'cache.py').write_text('w = 2\n')
+    versions.append(cache.module_version(module))
+    assert versions[0] == versions[1]
+    assert len(set(versions[1:])) == 3
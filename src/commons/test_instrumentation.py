@@ -0,0 +1,41 @@
+"""Tests for the solver instrumentation hooks."""
+
+import tracemalloc
+
+from src.commons import instrumentation
+
+
+def test_phase_peaks_are_relative_and_nest():
+    """Test that phase peaks exclude prior memory and survive nested phases."""
+    with instrumentation.profiling():
+        instrumentation.reset()
+        ballast = bytearray(8 << 20)
+        with instrumentation.timed('outer'):
+            chunk = bytearray(4 << 20)
+            del chunk
+            with instrumentation.timed('inner'):
+                pass
+        phases = instrumentation.report()['phases']
+        del ballast
+        instrumentation.reset()
+    assert phases['inner']['peak_bytes'] < 1 << 20
+    assert phases['outer']['peak_bytes'] >= 4 << 20
+    assert phases['outer']['peak_bytes'] < 6 << 20
+
+
+def test_profiling_restores_previous_state():
+    """Test that profiling() leaves instrumentation and tracemalloc as found."""
+    assert not instrumentation.is_enabled()
+    with instrumentation.profiling():
+        assert instrumentation.is_enabled()
+        assert tracemalloc.is_tracing()
+    assert not instrumentation.is_enabled()
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    try:
+        with instrumentation.profiling():
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
@@ -1,3 +1,25 @@
+from array import array
+from itertools import islice
+from typing import Iterable, Sequence
+
+from src.commons.instrumentation import count, timed
+from src.commons.int_array import pack_ints
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+# Deltas above this magnitude stay Python ints so per-rotation int64
+# arithmetic cannot overflow; totals over many rotations still can, so they
+# are summed with _sum_exact
+NUMPY_SAFE_LIMIT = 1 << 62
+# Split point used to sum int64 values without overflowing
+SUM_SPLIT = 10 ** 9
+# Instruction lines parsed per block when folding or sweeping a stream
+BLOCK_LINES = 1 << 16
+
+
 def parse_rotation(line: str) -> tuple[str, int]:
     """
     Parse a rotation instruction like 'L68' or 'R48'.
@@ -47,61 +69,419 @@ def apply_rotation(current: int, direction: str, distance: int) -> int:
         return (current + distance) % 100
 
 
-def solve_part1(input_lines: list[str]) -> int:
+def parse_rotations(input_lines: Iterable[str]) -> array | tuple[int, ...]:
     """
-    Solve Part 1 of Day 1: Count how many times dial points at 0.
+    Parse the whole instruction stream into signed rotation deltas.
     
     Args:
-        input_lines: List of rotation instructions
+        input_lines: Iterable of rotation instructions, consumed once
         
     Returns:
-        Number of times dial ends up at position 0
+        array('q') of deltas, negative for 'L' and positive for 'R'; a tuple
+        of ints if a distance is too large for int64 arithmetic
+        
+    Raises:
+        ValueError: If any non-empty line is not a valid instruction
     """
-    position = 50  # Starting position
-    zero_count = 0
-    
-    for line in input_lines:
-        line = line.strip()
-        if not line:  # Skip empty lines
-            continue
+    def deltas():
+        for line in input_lines:
+            line = line.strip()
+            if not line:  # Skip empty lines
+                continue
             
-        direction, distance = parse_rotation(line)
-        position = apply_rotation(position, direction, distance)
+            direction, distance = parse_rotation(line)
+            yield -distance if direction == 'L' else distance
+    
+    return pack_ints(deltas(), NUMPY_SAFE_LIMIT)
+
+
+def simulate_dial(deltas: Sequence[int], start: int = 50,
+                  size: int = 100) -> tuple[int, int]:
+    """
+    Run all rotations and count how often the dial meets position 0.
+    
+    Positions come from a prefix sum of the deltas reduced modulo the dial
+    size. Passes through 0 are counted per rotation with floor division:
+    turning right by d from p meets 0 (p + d) // size times, and turning
+    left mirrors that from (size - p) % size. Uses NumPy when available.
+    
+    Args:
+        deltas: Signed rotation deltas from parse_rotations
+        start: Starting dial position
+        size: Number of positions on the dial
         
+    Returns:
+        tuple: (landings, passes) where landings counts rotations ending at 0
+              and passes counts every click that points at 0
+    """
+    if np is not None and isinstance(deltas, array) and len(deltas):
+        return _simulate_dial_numpy(deltas, start, size)
+    
+    position = start % size
+    landings = 0
+    passes = 0
+    
+    for delta in deltas:
+        if delta >= 0:
+            passes += (position + delta) // size
+        else:
+            passes += ((size - position) % size - delta) // size
+        
+        position = (position + delta) % size
         if position == 0:
-            zero_count += 1
+            landings += 1
+    
+    return landings, passes
+
+
+def _simulate_dial_numpy(deltas: array, start: int, size: int) -> tuple[int, int]:
+    """
+    Vectorized body of simulate_dial.
+    
+    Args:
+        deltas: Signed rotation deltas from parse_rotations
+        start: Starting dial position
+        size: Number of positions on the dial
+        
+    Returns:
+        tuple: (landings, passes) as in simulate_dial
+    """
+    steps = np.frombuffer(deltas, dtype=np.int64)
+    
+    # Reducing each step first keeps the prefix sum far from int64 overflow
+    positions = (start + np.cumsum(steps % size)) % size
+    previous = np.empty_like(positions)
+    previous[0] = start % size
+    previous[1:] = positions[:-1]
+    
+    right = steps >= 0
+    passes = np.where(
+        right,
+        (previous + steps) // size,
+        ((size - previous) % size - steps) // size,
+    )
+    
+    return int(np.count_nonzero(positions == 0)), _sum_exact(passes)
+
+
+def _sum_exact(values: "np.ndarray") -> int:
+    """Sum non-negative int64 values as a Python int without int64 overflow."""
+    high, low = np.divmod(values, SUM_SPLIT)
+    return int(high.sum()) * SUM_SPLIT + int(low.sum())
+
+
+class DialSummary:
+    """
+    Effect of a run of rotations on the dial, for every starting position.
+    
+    Summaries compose associatively with then(), so a long log can be
+    summarized in chunks and the chunk summaries combined in order.
+    """
+    
+    def __init__(self, size: int, offset: int, landings: list[int], passes: list[int]):
+        """
+        Wrap a summary.
+        
+        Args:
+            size: Number of positions on the dial
+            offset: Net rotation of the run, modulo size
+            landings: landings[s] is the number of rotations ending at 0
+                      when the run starts at position s
+            passes: passes[s] is the number of clicks pointing at 0 when
+                    the run starts at position s
+        """
+        self.size = size
+        self.offset = offset
+        self.landings = landings
+        self.passes = passes
+    
+    @classmethod
+    def identity(cls, size: int = 100) -> 'DialSummary':
+        """Return the summary of an empty run."""
+        return cls(size, 0, [0] * size, [0] * size)
     
-    return zero_count
+    def then(self, other: 'DialSummary') -> 'DialSummary':
+        """
+        Compose this run with a run that follows it.
+        
+        The second run starts where this one ends, i.e. at s + offset.
+        
+        Args:
+            other: Summary of the following rotations, same dial size
+            
+        Returns:
+            Summary of both runs in sequence
+        """
+        size = self.size
+        shift = self.offset
+        return DialSummary(
+            size,
+            (self.offset + other.offset) % size,
+            [self.landings[s] + other.landings[(s + shift) % size]
+             for s in range(size)],
+            [self.passes[s] + other.passes[(s + shift) % size]
+             for s in range(size)],
+        )
 
 
-def solve_part2(input_lines: list[str]) -> int:
+def summarize_deltas(deltas: Sequence[int], size: int = 100) -> DialSummary:
     """
-    Placeholder for Part 2 solution.
+    Summarize rotations for all starting positions in one pass.
+    
+    From start s the dial sits at (s + P) % size after a prefix with sum P,
+    so landings form a histogram of -P modulo size. A rotation by d from
+    position p meets 0 |d| // size times plus once more when p lies in a
+    window of |d| % size positions next to 0; that window is a cyclic range
+    of starts, added with a difference array. Uses NumPy when available.
     
     Args:
-        input_lines: List of rotation instructions
+        deltas: Signed rotation deltas from parse_rotations
+        size: Number of positions on the dial
         
     Returns:
-        Part 2 result (placeholder)
+        DialSummary of the rotations
     """
-    # Part 2 implementation will go here
-    return 0
+    if np is not None and isinstance(deltas, array) and len(deltas):
+        return _summarize_deltas_numpy(deltas, size)
+    
+    landings = [0] * size
+    window_diff = [0] * (size + 1)
+    base_passes = 0
+    prefix = 0
+    
+    for delta in deltas:
+        full_turns, remainder = divmod(abs(delta), size)
+        base_passes += full_turns
+        if remainder:
+            # Starts whose position before this rotation lies in the window
+            if delta > 0:
+                first = (size - remainder - prefix) % size
+            else:
+                first = (1 - prefix) % size
+            _add_cyclic_range(window_diff, first, remainder, size)
+        
+        prefix = (prefix + delta) % size
+        landings[-prefix % size] += 1
+    
+    passes = []
+    running = base_passes
+    for s in range(size):
+        running += window_diff[s]
+        passes.append(running)
+    
+    return DialSummary(size, prefix, landings, passes)
+
+
+def _add_cyclic_range(diff: list[int], first: int, length: int, size: int) -> None:
+    """Add 1 over length positions from first, wrapping around the dial."""
+    diff[first] += 1
+    end = first + length
+    if end <= size:
+        diff[end] -= 1
+    else:
+        diff[0] += 1
+        diff[end - size] -= 1
+
+
+def _summarize_deltas_numpy(deltas: array, size: int) -> DialSummary:
+    """
+    Vectorized body of summarize_deltas.
+    
+    Args:
+        deltas: Signed rotation deltas from parse_rotations
+        size: Number of positions on the dial
+        
+    Returns:
+        DialSummary as in summarize_deltas
+    """
+    steps = np.frombuffer(deltas, dtype=np.int64)
+    
+    positions = np.cumsum(steps % size) % size
+    previous = np.empty_like(positions)
+    previous[0] = 0
+    previous[1:] = positions[:-1]
+    
+    full_turns, remainders = np.divmod(np.abs(steps), size)
+    firsts = np.where(steps > 0, size - remainders - previous, 1 - previous) % size
+    firsts = firsts[remainders > 0]
+    ends = firsts + remainders[remainders > 0]
+    wrapped = ends > size
+    
+    window_diff = (np.bincount(firsts, minlength=size + 1)
+                   - np.bincount(ends[~wrapped], minlength=size + 1)
+                   - np.bincount(ends[wrapped] - size, minlength=size + 1))
+    window_diff[0] += np.count_nonzero(wrapped)
+    
+    landings = np.bincount(-positions % size, minlength=size)
+    # Full turns can total more than int64 holds, so add them as a Python int
+    turns = _sum_exact(full_turns)
+    passes = np.cumsum(window_diff[:size]).tolist()
+    
+    return DialSummary(size, int(positions[-1]), landings.tolist(),
+                       [turns + value for value in passes])
+
+
+def fold_dial(input_lines: Iterable[str], start: int = 50,
+              size: int = 100) -> tuple[int, int]:
+    """
+    Run a rotation stream block by block in constant memory.
+    
+    Each block of lines is parsed and simulated from the position the
+    previous block ended at, so only one block of deltas is alive at once.
+    
+    Args:
+        input_lines: Iterable of rotation instructions, consumed once
+        start: Starting dial position
+        size: Number of positions on the dial
+        
+    Returns:
+        tuple: (landings, passes) as simulate_dial returns for the whole stream
+        
+    Raises:
+        ValueError: If any non-empty line is not a valid instruction
+    """
+    position = start % size
+    landings = 0
+    passes = 0
+    lines = iter(input_lines)
+    
+    while block := list(islice(lines, BLOCK_LINES)):
+        with timed('day1.parse'):
+            deltas = parse_rotations(block)
+        count('day1.rotations', len(deltas))
+        block_landings, block_passes = simulate_dial(deltas, position, size)
+        landings += block_landings
+        passes += block_passes
+        position = (position + sum(deltas)) % size
+    
+    return landings, passes
+
+
+def sweep_dial(input_lines: Iterable[str],
+               sizes: Iterable[int] = (100,)) -> dict[int, DialSummary]:
+    """
+    Evaluate a rotation stream from every start position, for several dial sizes.
+    
+    The stream is read once, in blocks; each block is parsed once and
+    folded into one DialSummary per dial size, so the cost is one pass per
+    size instead of one run per start position.
+    
+    Args:
+        input_lines: Iterable of rotation instructions, consumed once
+        sizes: Dial sizes (moduli) to evaluate
+        
+    Returns:
+        Dict from dial size to its DialSummary; summary.landings[s] and
+        summary.passes[s] are the part 1 and part 2 answers starting at s
+        
+    Raises:
+        ValueError: If any non-empty line is not a valid instruction
+    """
+    summaries = {size: DialSummary.identity(size) for size in sizes}
+    lines = iter(input_lines)
+    
+    while block := list(islice(lines, BLOCK_LINES)):
+        deltas = parse_rotations(block)
+        for size, summary in summaries.items():
+            summaries[size] = summary.then(summarize_deltas(deltas, size))
+    
+    return summaries
+
+
+@timed('day1.parse')
+def parse_input(input_lines: Iterable[str]) -> array | tuple[int, ...]:
+    """
+    Parse the puzzle input into the model shared by both parts.
+    
+    Args:
+        input_lines: Iterable of rotation instructions
+        
+    Returns:
+        array('q') of signed rotation deltas (see parse_rotations)
+    """
+    deltas = parse_rotations(input_lines)
+    count('day1.rotations', len(deltas))
+    return deltas
+
+
+@timed('day1.part1')
+def solve_part1_parsed(deltas: Sequence[int]) -> int:
+    """
+    Solve Part 1 of Day 1 from pre-parsed rotation deltas.
+    
+    Args:
+        deltas: Signed rotation deltas from parse_input
+        
+    Returns:
+        Number of times dial ends up at position 0
+    """
+    landings, _ = simulate_dial(deltas)
+    return landings
+
+
+@timed('day1.part2')
+def solve_part2_parsed(deltas: Sequence[int]) -> int:
+    """
+    Solve Part 2 of Day 1 from pre-parsed rotation deltas.
+    
+    Args:
+        deltas: Signed rotation deltas from parse_input
+        
+    Returns:
+        Number of times the dial points at 0, during or at the end of a rotation
+    """
+    _, passes = simulate_dial(deltas)
+    return passes
+
+
+@timed('day1.part1')
+def solve_part1(input_lines: Iterable[str]) -> int:
+    """
+    Solve Part 1 of Day 1: Count how many times dial points at 0.
+    
+    Args:
+        input_lines: Iterable of rotation instructions
+        
+    Returns:
+        Number of times dial ends up at position 0
+    """
+    landings, _ = fold_dial(input_lines)
+    return landings
+
+
+@timed('day1.part2')
+def solve_part2(input_lines: Iterable[str]) -> int:
+    """
+    Solve Part 2 of Day 1: Count every click that points the dial at 0.
+    
+    Args:
+        input_lines: Iterable of rotation instructions
+        
+    Returns:
+        Number of times the dial points at 0, during or at the end of a rotation
+    """
+    _, passes = fold_dial(input_lines)
+    return passes
 
 
 def main():
     """Main function to run the solution."""
     import sys
-    from src.commons.file_parser import parse_input_file
+    from src.commons.file_parser import InputFileError, load_parsed_input
 
     if len(sys.argv) != 2:
         print("Usage: python day1.py <input_file>")
         sys.exit(1)
     
     filename = sys.argv[1]
-    lines = parse_input_file(filename)
+    try:
+        parsed = load_parsed_input(filename, parse_input)
+    except InputFileError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     
-    part1_result = solve_part1(lines)
-    part2_result = solve_part2(lines)
+    part1_result = solve_part1_parsed(parsed)
+    part2_result = solve_part2_parsed(parsed)
     
     print(f"Part 1: {part1_result}")
     print(f"Part 2: {part2_result}")
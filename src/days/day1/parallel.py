@@ -0,0 +1,117 @@
+"""Chunked multi-core evaluation of Day 1 rotation logs.
+
+The log file is split by byte offset into chunks that end on line breaks.
+Each worker streams its chunk in blocks, summarizes the rotations for every
+starting position (a DialSummary), and the summaries are combined in file
+order. Composition is associative, so the result matches the serial fold
+no matter how the file is cut.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+from src.commons.file_parser import input_file_errors
+from src.days.day1.day1 import DialSummary, parse_rotations, summarize_deltas
+
+CHUNKS_PER_WORKER = 4
+BLOCK_SIZE = 1 << 24
+
+
+def chunk_offsets(filename: str, chunks: int) -> list[tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        filename: Path to the rotation log
+        chunks: Desired number of chunks
+
+    Returns:
+        List of (begin, end) byte offsets covering the file in order;
+        empty chunks are dropped
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be read
+    """
+    with input_file_errors(filename), open(filename, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        boundaries = [0]
+        for index in range(1, chunks):
+            target = max(size * index // chunks, boundaries[-1])
+            f.seek(target)
+            # Move past the line that straddles the target offset
+            f.readline()
+            boundaries.append(min(f.tell(), size))
+        boundaries.append(size)
+
+    return [(begin, end) for begin, end in zip(boundaries, boundaries[1:])
+            if end > begin]
+
+
+def summarize_file_chunk(filename: str, begin: int, end: int,
+                         size: int = 100) -> DialSummary:
+    """
+    Summarize the rotations in one byte range of a log, block by block.
+
+    Args:
+        filename: Path to the rotation log
+        begin: First byte of the chunk, at the start of a line
+        end: Byte just past the chunk, at the start of a line or end of file
+        size: Number of positions on the dial
+
+    Returns:
+        DialSummary of the chunk's rotations
+    """
+    summary = DialSummary.identity(size)
+    carry = b''
+
+    with open(filename, 'rb') as f:
+        f.seek(begin)
+        remaining = end - begin
+        while remaining > 0:
+            block = carry + f.read(min(BLOCK_SIZE, remaining))
+            remaining -= len(block) - len(carry)
+            # Keep a partial last line for the next block
+            cut = block.rfind(b'\n') + 1 if remaining > 0 else len(block)
+            block, carry = block[:cut], block[cut:]
+            lines = block.decode('ascii').splitlines()
+            summary = summary.then(summarize_deltas(parse_rotations(lines), size))
+
+    return summary
+
+
+def simulate_dial_parallel(filename: str, start: int = 50, size: int = 100,
+                           workers: int | None = None) -> tuple[int, int]:
+    """
+    Run a rotation log across a process pool.
+
+    Args:
+        filename: Path to the rotation log
+        start: Starting dial position
+        size: Number of positions on the dial
+        workers: Number of worker processes (default: one per CPU)
+
+    Returns:
+        tuple: (landings, passes) as simulate_dial returns for the whole log
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be read
+        ValueError: If any non-empty line is not a valid instruction
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = chunk_offsets(filename, workers * CHUNKS_PER_WORKER)
+
+    if workers == 1:
+        summaries = [summarize_file_chunk(filename, begin, end, size)
+                     for begin, end in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map yields in submission order, which keeps the combine ordered
+            summaries = list(executor.map(summarize_file_chunk,
+                                          [filename] * len(chunks), *zip(*chunks),
+                                          [size] * len(chunks)))
+
+    summary = reduce(DialSummary.then, summaries, DialSummary.identity(size))
+    return summary.landings[start % size], summary.passes[start % size]
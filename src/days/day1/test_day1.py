@@ -17,4 +17,114 @@ def test_part2():
     from src.commons.file_parser import parse_input_file
     lines = parse_input_file('src/days/day1/demo.txt')
     result = solve_part2(lines)
-    assert result == 0
\ No newline at end of file
+    assert result == 6
+
+
+def test_dial_engine_matches_click_stepping(monkeypatch):
+    """Test closed-form dial counts against click-by-click stepping."""
+    from src.days.day1 import day1
+    deltas = day1.array('q', [-68, -30, 48, -5, 60, -55, -1, -99, 14, -82,
+                              250, -300, 0, 1000, -1, 100])
+    position, landings, passes = 50, 0, 0
+    for delta in deltas:
+        for _ in range(abs(delta)):
+            position = (position + (1 if delta > 0 else -1)) % 100
+            passes += position == 0
+        landings += position == 0
+    assert day1.simulate_dial(deltas) == (landings, passes)
+    monkeypatch.setattr(day1, 'np', None)
+    assert day1.simulate_dial(deltas) == (landings, passes)
+
+
+def test_streaming_input():
+    """Test solving directly from the lazy line iterator."""
+    from src.commons.file_parser import iter_input_lines
+    assert solve_part1(iter_input_lines('src/days/day1/demo.txt', buffer_size=16)) == 3
+    assert solve_part2(iter_input_lines('src/days/day1/demo.txt')) == 6
+
+
+def test_block_fold_matches_whole_simulation(monkeypatch):
+    """Test that folding small blocks carries position and counts across blocks."""
+    import random
+    from src.days.day1 import day1
+    rng = random.Random(8)
+    lines = [f"{rng.choice('LR')}{rng.randint(1, 350)}" for _ in range(200)]
+    monkeypatch.setattr(day1, 'BLOCK_LINES', 7)
+    expected = day1.simulate_dial(day1.parse_rotations(lines), 13)
+    assert day1.fold_dial(iter(lines), 13) == expected
+
+
+def test_missing_input_raises():
+    """Test that the streaming reader raises instead of exiting."""
+    from src.commons.file_parser import InputFileNotFoundError, iter_input_lines
+    with pytest.raises(InputFileNotFoundError):
+        iter_input_lines('src/days/day1/missing.txt')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parallel_chunks_match_serial(tmp_path, monkeypatch, workers):
+    """Test chunked summaries combined in order against the serial fold."""
+    import random
+    from src.days.day1 import parallel
+    from src.days.day1.day1 import parse_rotations, simulate_dial
+    rng = random.Random(24)
+    lines = [f"{rng.choice('LR')}{rng.randint(1, 450)}" for _ in range(500)]
+    path = tmp_path / 'log.txt'
+    path.write_text('\n'.join(lines) + '\n')
+    monkeypatch.setattr(parallel, 'BLOCK_SIZE', 64)
+    expected = simulate_dial(parse_rotations(lines), 17)
+    assert parallel.simulate_dial_parallel(str(path), 17, workers=workers) == expected
+    demo = 'src/days/day1/demo.txt'
+    assert parallel.simulate_dial_parallel(demo, workers=workers) == (3, 6)
+
+
+def test_sweep_all_starts_and_sizes(monkeypatch):
+    """Test one-pass sweeps against separate runs per start position and size."""
+    from src.commons.file_parser import iter_input_lines, parse_input_file
+    from src.days.day1 import day1
+    from src.days.day1.day1 import parse_rotations, simulate_dial, sweep_dial
+    monkeypatch.setattr(day1, 'BLOCK_LINES', 3)
+    summaries = sweep_dial(iter_input_lines('src/days/day1/demo.txt'), sizes=(100, 12))
+    deltas = parse_rotations(parse_input_file('src/days/day1/demo.txt'))
+    for size, summary in summaries.items():
+        for start in range(size):
+            expected = simulate_dial(deltas, start, size)
+            assert (summary.landings[start], summary.passes[start]) == expected
+    assert (summaries[100].landings[50], summaries[100].passes[50]) == (3, 6)
+
+
+def test_distances_beyond_int64():
+    """Test that huge rotation distances fall back to Python ints."""
+    from src.days.day1.day1 import parse_rotations, simulate_dial
+    lines = ['L68', 'R100000000000000000050', 'L99999999999999999999']
+    deltas = parse_rotations(lines)
+    assert deltas == (-68, 100000000000000000050, -99999999999999999999)
+    position, landings, passes = 50, 0, 0
+    for delta in deltas:
+        target = position + delta
+        passes += abs(target // 100 - position // 100) if delta > 0 else \
+            abs((position - 1) // 100 - (target - 1) // 100)
+        position = target % 100
+        landings += position == 0
+    assert simulate_dial(deltas) == (landings, passes)
+    assert (solve_part1(lines), solve_part2(lines)) == (landings, passes)
+
+
+def test_pass_total_beyond_int64():
+    """Test that pass counts summed over many large rotations do not wrap."""
+    from src.days.day1.day1 import parse_input, solve_part2_parsed
+    lines = ['R4000000000000000000'] * 300
+    assert solve_part2(lines) == 12000000000000000000
+    assert solve_part2_parsed(parse_input(lines)) == 12000000000000000000
+
+
+def test_summary_total_beyond_int64(tmp_path):
+    """Test that composed summaries count full turns beyond int64 exactly."""
+    from src.days.day1 import parallel
+    from src.days.day1.day1 import sweep_dial
+    lines = ['R4000000000000000000'] * 300
+    assert sweep_dial(lines)[100].passes[50] == 12000000000000000000
+    path = tmp_path / 'rotations.txt'
+    path.write_text('\n'.join(lines))
+    result = parallel.simulate_dial_parallel(str(path), workers=1)
+    assert result == (0, 12000000000000000000)
@@ -1,3 +1,10 @@
+import hashlib
+from typing import Iterable
+
+from src.commons.checkpoint import Checkpointer
+from src.commons.instrumentation import count, timed
+
+
 def parse_ranges(input_line: str) -> list[tuple[str, str]]:
     """
     Parse comma-separated ranges into list of (start, end) string tuples.
@@ -71,43 +78,178 @@ def is_invalid_id_part2(num_str: str) -> bool:
     return False
 
 
-def solve_part1(input_lines: list[str]) -> int:
+def _prime_factors(n: int) -> list[int]:
     """
-    Solve Part 1 of Day 2: Find and sum all invalid IDs in ranges.
+    Return the distinct prime factors of n in ascending order.
     
     Args:
-        input_lines: List containing a single line with comma-separated ranges
+        n: Positive integer to factorize
         
     Returns:
-        Sum of all invalid IDs found in the given ranges
+        List of distinct prime factors
+    """
+    factors = []
+    divisor = 2
+    while divisor * divisor <= n:
+        if n % divisor == 0:
+            factors.append(divisor)
+            while n % divisor == 0:
+                n //= divisor
+        divisor += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def sum_periodic_ids(start: int, end: int, length: int, period: int) -> int:
+    """
+    Sum all length-digit numbers in [start, end] made of a period-digit block repeated.
+    
+    Every such number is X * M where X is the period-digit block and
+    M = (10^length - 1) / (10^period - 1) is the repunit multiplier
+    (e.g. 1001 for a 3-digit block repeated twice). The matching blocks form a
+    contiguous run of integers, so the sum is an arithmetic series times M.
+    
+    Args:
+        start: Inclusive lower bound of the range
+        end: Inclusive upper bound of the range
+        length: Total number of digits of the generated numbers
+        period: Number of digits in the repeated block (must divide length)
         
-    Raises:
-        ValueError: If input format is invalid or contains non-numeric data
+    Returns:
+        Sum of the matching numbers inside the range
     """
-    if not input_lines:
+    multiplier = (10 ** length - 1) // (10 ** period - 1)
+    
+    # Blocks must have exactly `period` digits (no leading zero)
+    low_block = max(10 ** (period - 1), -(-start // multiplier))
+    high_block = min(10 ** period - 1, end // multiplier)
+    
+    if low_block > high_block:
         return 0
     
-    # Parse ranges from the first line
-    input_line = input_lines[0].strip()
-    ranges = parse_ranges(input_line)
+    block_count = high_block - low_block + 1
+    return multiplier * (low_block + high_block) * block_count // 2
+
+
+def sum_invalid_ids_in_range(start: int, end: int,
+                             any_repetition: bool = False) -> int:
+    """
+    Sum all invalid IDs in [start, end] without iterating over the range.
+    
+    Numbers are generated per digit length directly from their repeated block.
+    For part 1 only the "XX" shape (block repeated exactly twice) counts. For
+    part 2 a number is invalid if it repeats with any period p that divides its
+    length L with L / p >= 2; such a number always repeats with some period
+    L / q for a prime q dividing L, and numbers repeating with several of
+    those periods also repeat with their gcd, so the union is summed with
+    inclusion-exclusion over squarefree products of those primes.
+    
+    Args:
+        start: Inclusive lower bound of the range
+        end: Inclusive upper bound of the range
+        any_repetition: False for part 1 rules, True for part 2 rules
+        
+    Returns:
+        Sum of invalid IDs inside the range
+    """
+    if start > end:
+        return 0
     
     total_sum = 0
     
-    for start_str, end_str in ranges:
-        # Convert to integers only for range iteration
-        start_num = int(start_str)
-        end_num = int(end_str)
+    for length in range(max(len(str(max(start, 1))), 2), len(str(end)) + 1):
+        # Clamp the range to numbers with exactly `length` digits
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10 ** length - 1)
+        if low > high:
+            continue
         
-        # Iterate through each number in the range
-        for num in range(start_num, end_num + 1):
-            # Convert back to string for validation
-            num_str = str(num)
-            if is_invalid_id(num_str):
-                total_sum += num
+        if not any_repetition:
+            if length % 2 == 0:
+                total_sum += sum_periodic_ids(low, high, length, length // 2)
+            continue
+        
+        primes = _prime_factors(length)
+        for mask in range(1, 1 << len(primes)):
+            divisor = 1
+            bits = 0
+            for index, prime in enumerate(primes):
+                if mask >> index & 1:
+                    divisor *= prime
+                    bits += 1
+            sign = 1 if bits % 2 == 1 else -1
+            total_sum += sign * sum_periodic_ids(low, high, length, length // divisor)
     
     return total_sum
 
 
+@timed('day2.parse')
+def parse_input(input_lines: Iterable[str]) -> tuple[tuple[int, int], ...]:
+    """
+    Parse the puzzle input into the model shared by both parts.
+    
+    Args:
+        input_lines: Iterable whose first line holds comma-separated ranges
+        
+    Returns:
+        Tuple of (start, end) integer ranges
+        
+    Raises:
+        ValueError: If a range bound is not numeric
+    """
+    input_line = next(iter(input_lines), '').strip()
+    ranges = tuple((int(start_str), int(end_str))
+                   for start_str, end_str in parse_ranges(input_line))
+    count('day2.ranges', len(ranges))
+    return ranges
+
+
+@timed('day2.part1')
+def solve_part1_parsed(ranges: tuple[tuple[int, int], ...]) -> int:
+    """
+    Solve Part 1 of Day 2 from pre-parsed ranges.
+    
+    Args:
+        ranges: Tuple of (start, end) integer ranges from parse_input
+        
+    Returns:
+        Sum of all invalid IDs found in the given ranges
+    """
+    return sum(sum_invalid_ids_in_range(start, end) for start, end in ranges)
+
+
+@timed('day2.part2')
+def solve_part2_parsed(ranges: tuple[tuple[int, int], ...]) -> int:
+    """
+    Solve Part 2 of Day 2 from pre-parsed ranges.
+    
+    Args:
+        ranges: Tuple of (start, end) integer ranges from parse_input
+        
+    Returns:
+        Sum of all invalid IDs found in the given ranges using new rules
+    """
+    return sum(sum_invalid_ids_in_range(start, end, any_repetition=True)
+               for start, end in ranges)
+
+
+def solve_part1(input_lines: list[str]) -> int:
+    """
+    Solve Part 1 of Day 2: Find and sum all invalid IDs in ranges.
+    
+    Args:
+        input_lines: List containing a single line with comma-separated ranges
+        
+    Returns:
+        Sum of all invalid IDs found in the given ranges
+        
+    Raises:
+        ValueError: If input format is invalid or contains non-numeric data
+    """
+    return solve_part1_parsed(parse_input(input_lines))
+
+
 def solve_part2(input_lines: list[str]) -> int:
     """
     Solve Part 2 of Day 2: Find and sum all invalid IDs with repeated patterns.
@@ -121,44 +263,106 @@ def solve_part2(input_lines: list[str]) -> int:
     Raises:
         ValueError: If input format is invalid or contains non-numeric data
     """
-    if not input_lines:
-        return 0
+    return solve_part2_parsed(parse_input(input_lines))
+
+
+def ranges_fingerprint(ranges: tuple[tuple[int, int], ...]) -> bytes:
+    """
+    Digest identifying a range list, used to match checkpoints.
+    
+    Args:
+        ranges: Tuple of (start, end) integer ranges
+        
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    return hashlib.blake2b(repr(ranges).encode('ascii'), digest_size=16).digest()
+
+
+def sum_invalid_ids_resumable(ranges: tuple[tuple[int, int], ...],
+                              checkpointer: Checkpointer,
+                              any_repetition: bool = False) -> int:
+    """
+    Sum invalid IDs over all ranges with periodic checkpoints.
     
-    # Parse ranges from the first line
-    input_line = input_lines[0].strip()
-    ranges = parse_ranges(input_line)
+    Work advances one digit length of one range at a time. The checkpoint
+    stores the range index, the next number to process in that range and
+    the partial sum, and is removed once the run completes.
     
-    total_sum = 0
+    Args:
+        ranges: Tuple of (start, end) integer ranges
+        checkpointer: Checkpointer whose fingerprint came from ranges_fingerprint
+        any_repetition: False for part 1 rules, True for part 2 rules
+        
+    Returns:
+        Sum of invalid IDs over all ranges
+    """
+    state = checkpointer.load()
+    if state is None:
+        range_index, number, total_sum = 0, None, 0
+    else:
+        (range_index, number, total_sum), _ = state
     
-    for start_str, end_str in ranges:
-        # Convert to integers only for range iteration
-        start_num = int(start_str)
-        end_num = int(end_str)
+    for index in range(range_index, len(ranges)):
+        start, end = ranges[index]
+        if number is None:
+            number = start
         
-        # Iterate through each number in the range
-        for num in range(start_num, end_num + 1):
-            # Convert back to string for validation
-            num_str = str(num)
-            if is_invalid_id_part2(num_str):
-                total_sum += num
+        while number <= end:
+            chunk_end = min(end, 10 ** len(str(number)) - 1)
+            total_sum += sum_invalid_ids_in_range(number, chunk_end, any_repetition)
+            number = chunk_end + 1
+            checkpointer.maybe_save([index, number, total_sum])
+        
+        number = None
     
+    checkpointer.clear()
     return total_sum
 
 
 def main():
     """Main function to run the solution."""
+    import argparse
     import sys
-    from src.commons.file_parser import parse_input_file
+    from src.commons.checkpoint import DEFAULT_INTERVAL, CheckpointError
+    from src.commons.file_parser import InputFileError, load_parsed_input
 
-    if len(sys.argv) != 2:
-        print("Usage: python day2.py <input_file>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(prog='python day2.py')
+    parser.add_argument('input_file')
+    parser.add_argument('--checkpoint',
+                        help='Save progress to this path '
+                             '(.part1/.part2 suffixes are added)')
+    parser.add_argument('--checkpoint-interval', type=float, default=DEFAULT_INTERVAL,
+                        help='Seconds between checkpoints (default: 60)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue from existing checkpoint files')
+    args = parser.parse_args()
     
-    filename = sys.argv[1]
-    lines = parse_input_file(filename)
+    filename = args.input_file
+    try:
+        parsed = load_parsed_input(filename, parse_input)
+    except InputFileError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     
-    part1_result = solve_part1(lines)
-    part2_result = solve_part2(lines)
+    if args.checkpoint:
+        fingerprint = ranges_fingerprint(parsed)
+        results = []
+        for part in (1, 2):
+            checkpointer = Checkpointer(f"{args.checkpoint}.part{part}",
+                                        f"day2.part{part}", fingerprint,
+                                        interval=args.checkpoint_interval,
+                                        resume=args.resume)
+            try:
+                result = sum_invalid_ids_resumable(parsed, checkpointer, part == 2)
+                results.append(result)
+            except CheckpointError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+        part1_result, part2_result = results
+    else:
+        part1_result = solve_part1_parsed(parsed)
+        part2_result = solve_part2_parsed(parsed)
     
     print(f"Part 1: {part1_result}")
     print(f"Part 2: {part2_result}")
@@ -0,0 +1,52 @@
+"""Chunked multi-core evaluation of Day 2 range sums.
+
+Invalid-ID sums are additive per input range, so the range list is cut
+into contiguous batches in fixed order and each worker runs the closed-form
+engine (which splits a range at digit-length boundaries itself) over its
+batch. The parent only slices the list and adds up the partial sums, so
+overlapping ranges still count their shared IDs once per range exactly like
+the serial solver.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+from src.days.day2.day2 import sum_invalid_ids_in_range
+
+BATCHES_PER_WORKER = 4
+
+
+def _sum_range_batch(batch: Sequence[tuple[int, int]], any_repetition: bool) -> int:
+    """Sum the invalid IDs of a batch of ranges."""
+    return sum(sum_invalid_ids_in_range(start, end, any_repetition)
+               for start, end in batch)
+
+
+def sum_invalid_ids_parallel(ranges: Sequence[tuple[int, int]],
+                             any_repetition: bool = False,
+                             workers: int | None = None) -> int:
+    """
+    Sum invalid IDs over all ranges using a process pool.
+
+    Args:
+        ranges: Sequence of (start, end) inclusive ranges
+        any_repetition: False for part 1 rules, True for part 2 rules
+        workers: Number of worker processes (default: one per CPU)
+
+    Returns:
+        Same total as summing sum_invalid_ids_in_range over ranges serially
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(ranges) < 2:
+        return _sum_range_batch(ranges, any_repetition)
+
+    batch_count = min(len(ranges), workers * BATCHES_PER_WORKER)
+    # Contiguous, equally sized batches keep the split deterministic
+    batch_size = -(-len(ranges) // batch_count)
+    batches = [ranges[i:i + batch_size] for i in range(0, len(ranges), batch_size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(_sum_range_batch, batches,
+                                [any_repetition] * len(batches))
+        return sum(partials)
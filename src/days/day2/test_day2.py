@@ -17,4 +17,62 @@ def test_part2():
     from src.commons.file_parser import parse_input_file
     lines = parse_input_file('src/days/day2/demo.txt')
     result = solve_part2(lines)
-    assert result == 4174379265
\ No newline at end of file
+    assert result == 4174379265
+
+
+def test_closed_form_matches_brute_force():
+    """Test closed-form range sums against per-number checks."""
+    from src.days.day2.day2 import (
+        is_invalid_id, is_invalid_id_part2, sum_invalid_ids_in_range
+    )
+    for start, end in [(1, 1200), (95, 115), (99990, 101100), (111100, 112000)]:
+        numbers = range(start, end + 1)
+        assert sum_invalid_ids_in_range(start, end) == sum(
+            n for n in numbers if is_invalid_id(str(n)))
+        assert sum_invalid_ids_in_range(start, end, any_repetition=True) == sum(
+            n for n in numbers if is_invalid_id_part2(str(n)))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parallel_matches_serial(workers):
+    """Test pooled batch sums, including overlapping ranges, against serial sums."""
+    from src.commons.file_parser import parse_input_file
+    from src.days.day2.day2 import parse_input, solve_part1_parsed, solve_part2_parsed
+    from src.days.day2.parallel import sum_invalid_ids_parallel
+    ranges = parse_input(parse_input_file('src/days/day2/demo.txt'))
+    ranges += ((10, 1200), (95, 115), (90, 99999))
+    part1 = sum_invalid_ids_parallel(list(ranges), workers=workers)
+    part2 = sum_invalid_ids_parallel(list(ranges), True, workers)
+    assert (part1, part2) == (solve_part1_parsed(ranges), solve_part2_parsed(ranges))
+
+
+def test_scan_resumes_from_checkpoint(tmp_path):
+    """Test that an interrupted range scan resumes to the same total."""
+    from src.commons.checkpoint import Checkpointer
+    from src.commons.file_parser import parse_input_file
+    from src.days.day2.day2 import (
+        parse_input, ranges_fingerprint, sum_invalid_ids_resumable
+    )
+
+    class Preempted(Exception):
+        pass
+
+    class PreemptingCheckpointer(Checkpointer):
+        saves = 0
+
+        def save(self, fields, blob=b''):
+            super().save(fields, blob)
+            self.saves += 1
+            if self.saves == 5:
+                raise Preempted
+
+    ranges = parse_input(parse_input_file('src/days/day2/demo.txt'))
+    path = str(tmp_path / 'day2.ckpt')
+    fingerprint = ranges_fingerprint(ranges)
+    with pytest.raises(Preempted):
+        preempting = PreemptingCheckpointer(path, 'day2.part2', fingerprint,
+                                            interval=0)
+        sum_invalid_ids_resumable(ranges, preempting, any_repetition=True)
+    resumed = Checkpointer(path, 'day2.part2', fingerprint, resume=True)
+    result = sum_invalid_ids_resumable(ranges, resumed, any_repetition=True)
+    assert result == 4174379265
@@ -1,163 +1,305 @@
 """Day 3 Advent of Code 2025 solution.
 
 This module contains solutions for calculating battery joltage totals
-using greedy selection algorithms for maximum value extraction.
+using a monotonic-stack selection for maximum value extraction.
 """
 
+import re
+from typing import Iterable, Iterator
 
-def find_max_joltage(line: str) -> int:
+from src.commons.file_parser import InputFileError, input_file_errors
+from src.commons.instrumentation import count, timed
+from src.days.day3 import vectorized
+
+# Whole-file check: every line is optional digits padded by non-newline whitespace
+BANKS_PATTERN = re.compile(rb'[^\S\n]*(?:[0-9]+[^\S\n]*)?'
+                           rb'(?:\n[^\S\n]*(?:[0-9]+[^\S\n]*)?)*')
+
+
+def select_max_digits(bank: bytes, k: int) -> int:
     """
-    Find maximum 2-digit number using the proposed O(N) approach.
+    Select the maximum k-digit number from a validated bank of ASCII digits.
+    
+    While scanning left to right, a smaller digit on top of the stack is
+    dropped in favour of a larger one as long as enough digits remain to
+    still fill k positions. Each digit is pushed and popped at most once,
+    so the cost is O(N) for any k.
+    
+    Args:
+        bank: ASCII digit bytes, already stripped and validated
+        k: Number of digits to select
+        
+    Returns:
+        Maximum k-digit number that can be formed (or 0 if bank too short)
+        
+    Raises:
+        ValueError: If k is less than 1
+    """
+    if k < 1:
+        raise ValueError(f"Digit count must be at least 1: {k}")
+    if len(bank) < k:
+        return 0
+    
+    stack = bytearray()
+    drops_left = len(bank) - k
+    
+    for digit in bank:
+        while drops_left and stack and stack[-1] < digit:
+            stack.pop()
+            drops_left -= 1
+        stack.append(digit)
+    
+    # Unused drops leave surplus digits at the tail
+    return int(stack[:k])
+
+
+def find_max_k_digit_joltage(line: str, k: int) -> int:
+    """
+    Find maximum k-digit number using a single-pass monotonic stack.
     
     Args:
         line: String of digits representing battery joltages
+        k: Number of digits to select
         
     Returns:
-        Maximum 2-digit number that can be formed
+        Maximum k-digit number that can be formed (or 0 if line too short)
         
     Raises:
-        ValueError: If line is empty or contains no digits
+        ValueError: If line is empty or contains no digits, or k is less than 1
     """
     line = line.strip()
     if not line:
         raise ValueError("Empty line provided")
-    if not line.isdigit():
+    if not (line.isascii() and line.isdigit()):
         raise ValueError("Line contains non-digit characters")
     
-    # Step 1: Find left-most largest digit
-    max_digit = '0'
-    max_pos = -1
+    return select_max_digits(line.encode('ascii'), k)
+
+
+def find_max_joltage(line: str) -> int:
+    """
+    Find maximum 2-digit number that can be formed from the bank.
     
-    for i, char in enumerate(line):
-        if char > max_digit:
-            max_digit = char
-            max_pos = i
+    Args:
+        line: String of digits representing battery joltages
+        
+    A bank holding a single battery yields that battery's digit, as the
+    original two-scan implementation did.
     
-    # Step 2: If max is last digit, find second largest (exclude last position)
-    if max_pos == len(line) - 1:
-        second_max_digit = '0'
-        second_max_pos = -1
+    Args:
+        line: String of digits representing battery joltages
         
-        # Only iterate up to the second to last position (exclusive)
-        for i in range(len(line) - 1):
-            if line[i] > second_max_digit:
-                second_max_digit = line[i]
-                second_max_pos = i
+    Returns:
+        Maximum 2-digit number that can be formed (the digit itself for a
+        one-digit bank)
         
-        max_digit = second_max_digit
-        max_pos = second_max_pos
-    
-    # Step 3: Find largest digit after the chosen digit
-    max_after = '0'
-    for i in range(max_pos + 1, len(line)):
-        if line[i] > max_after:
-            max_after = line[i]
-    
-    # Step 4: Form and return the 2-digit number
-    return int(max_digit + max_after)
+    Raises:
+        ValueError: If line is empty or contains no digits
+    """
+    return find_max_k_digit_joltage(line, 1 if len(line.strip()) == 1 else 2)
+
+
+def _pair_banks(banks: Iterable[bytes], lone: list[int]) -> Iterator[bytes]:
+    """Yield banks of two or more digits, adding one-digit banks' values to lone[0]."""
+    for bank in banks:
+        if len(bank) == 1:
+            lone[0] += bank[0] - ord('0')
+        else:
+            yield bank
 
 
-def solve_part1(input_lines: list[str]) -> int:
+def find_max_12_digit_joltage(line: str) -> int:
     """
-    Solve Part 1 of Day 3: Calculate total output joltage.
+    Find maximum 12-digit number that can be formed from the bank.
     
     Args:
-        input_lines: List of strings, each representing a bank of batteries
+        line: String of digits representing battery joltages
         
     Returns:
-        Sum of maximum joltage from each bank
+        Maximum 12-digit number that can be formed (or 0 if line too short)
+        
+    Raises:
+        ValueError: If line is empty or contains no digits
+    """
+    return find_max_k_digit_joltage(line, 12)
+
+
+def iter_banks(input_lines: Iterable[str]) -> Iterator[bytes]:
     """
-    total_joltage = 0
+    Validate banks and yield them as ASCII digit bytes, skipping blank lines.
     
+    Args:
+        input_lines: Iterable of strings, each representing a bank of batteries
+        
+    Returns:
+        Iterator over stripped digit banks as bytes
+        
+    Raises:
+        ValueError: If a bank contains non-digit characters
+    """
     for line in input_lines:
         line = line.strip()
         if not line:
             continue
-        total_joltage += find_max_joltage(line)
-    
-    return total_joltage
+        if not (line.isascii() and line.isdigit()):
+            raise ValueError("Line contains non-digit characters")
+        yield line.encode('ascii')
 
 
-def find_max_12_digit_joltage(line: str) -> int:
+def parse_banks(data: bytes) -> tuple[bytes, ...]:
     """
-    Find maximum 12-digit number using greedy selection algorithm.
+    Validate a whole input buffer once and split it into digit banks.
+    
+    One regex pass checks every line at once, so no per-bank strip or
+    isdigit calls are needed, and the banks come straight from the raw
+    ASCII bytes.
     
     Args:
-        line: String of digits representing battery joltages
+        data: Raw input bytes, one bank per line
         
     Returns:
-        Maximum 12-digit number that can be formed (or 0 if line too short)
+        Tuple of digit banks as bytes, blank lines skipped
         
     Raises:
-        ValueError: If line is empty or contains no digits
+        ValueError: If any bank contains non-digit characters
     """
-    line = line.strip()
-    if not line:
-        raise ValueError("Empty line provided")
-    if not line.isdigit():
+    if BANKS_PATTERN.fullmatch(data) is None:
         raise ValueError("Line contains non-digit characters")
     
-    if len(line) < 12:
-        return 0
+    # After validation, whitespace-separated tokens are exactly the banks
+    return tuple(data.split())
+
+
+@timed('day3.parse')
+def load_banks(filename: str) -> tuple[bytes, ...]:
+    """
+    Read an input file as raw bytes and parse its digit banks.
     
-    selected_digits = []
-    prev_pos = -1
+    Args:
+        filename: Path to the input file
+        
+    Returns:
+        Tuple of digit banks as bytes
+        
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be read
+        ValueError: If any bank contains non-digit characters
+    """
+    with input_file_errors(filename), open(filename, 'rb') as f:
+        data = f.read()
     
-    for k in range(12):  # k = 0 to 11 (12 positions)
-        # Search range: from prev_pos + 1 to len(line) - (12 - k)
-        start = prev_pos + 1
-        end = len(line) - (12 - k)
+    banks = parse_banks(data)
+    count('day3.banks', len(banks))
+    return banks
+
+
+@timed('day3.parse')
+def parse_input(input_lines: Iterable[str]) -> tuple[bytes, ...]:
+    """
+    Parse the puzzle input into the model shared by both parts.
+    
+    Args:
+        input_lines: Iterable of strings, each representing a bank of batteries
         
-        max_digit = '0'
-        max_pos = -1
+    Returns:
+        Tuple of validated digit banks as bytes
         
-        # Scan left-to-right, take first occurrence of largest digit
-        for i in range(start, end + 1):
-            if line[i] > max_digit:
-                max_digit = line[i]
-                max_pos = i
+    Raises:
+        ValueError: If any bank contains non-digit characters
+    """
+    try:
+        data = '\n'.join(input_lines).encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError("Line contains non-digit characters")
+    
+    banks = parse_banks(data)
+    count('day3.banks', len(banks))
+    return banks
+
+
+@timed('day3.part1')
+def solve_part1_parsed(banks: Iterable[bytes]) -> int:
+    """
+    Solve Part 1 of Day 3 from validated digit banks.
+    
+    Args:
+        banks: Digit banks as bytes, e.g. from parse_input
         
-        selected_digits.append(max_digit)
-        prev_pos = max_pos
+    Returns:
+        Sum of maximum joltage from each bank, where a one-digit bank
+        counts its digit (see find_max_joltage)
+    """
+    lone = [0]
+    banks = _pair_banks(banks, lone)
+    if vectorized.HAS_NUMPY:
+        total = vectorized.sum_max_digits(banks, 2)
+    else:
+        total = sum(select_max_digits(bank, 2) for bank in banks)
     
-    return int(''.join(selected_digits))
+    return total + lone[0]
 
 
-def solve_part2(input_lines: list[str]) -> int:
+@timed('day3.part2')
+def solve_part2_parsed(banks: Iterable[bytes]) -> int:
     """
-    Solve Part 2 of Day 3: Calculate total output joltage with 12 digits.
+    Solve Part 2 of Day 3 from validated digit banks.
     
     Args:
-        input_lines: List of strings, each representing a bank of batteries
+        banks: Digit banks as bytes, e.g. from parse_input
         
     Returns:
         Sum of maximum 12-digit joltage from each bank
     """
-    total_joltage = 0
+    if vectorized.HAS_NUMPY:
+        return vectorized.sum_max_digits(banks, 12)
     
-    for line in input_lines:
-        line = line.strip()
-        if not line:
-            continue
-        total_joltage += find_max_12_digit_joltage(line)
+    return sum(select_max_digits(bank, 12) for bank in banks)
+
+
+def solve_part1(input_lines: Iterable[str]) -> int:
+    """
+    Solve Part 1 of Day 3: Calculate total output joltage.
+    
+    Args:
+        input_lines: Iterable of strings, each representing a bank of batteries
+        
+    Returns:
+        Sum of maximum joltage from each bank
+    """
+    return solve_part1_parsed(iter_banks(input_lines))
+
+
+def solve_part2(input_lines: Iterable[str]) -> int:
+    """
+    Solve Part 2 of Day 3: Calculate total output joltage with 12 digits.
     
-    return total_joltage
+    Args:
+        input_lines: Iterable of strings, each representing a bank of batteries
+        
+    Returns:
+        Sum of maximum 12-digit joltage from each bank
+    """
+    return solve_part2_parsed(iter_banks(input_lines))
 
 
 def main():
     """Main function to run the solution."""
     import sys
-    from src.commons.file_parser import parse_input_file
 
     if len(sys.argv) != 2:
         print("Usage: python day3.py <input_file>")
         sys.exit(1)
     
     filename = sys.argv[1]
-    lines = parse_input_file(filename)
+    try:
+        parsed = load_banks(filename)
+    except InputFileError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     
-    part1_result = solve_part1(lines)
-    part2_result = solve_part2(lines)
+    part1_result = solve_part1_parsed(parsed)
+    part2_result = solve_part2_parsed(parsed)
     
     print(f"Part 1: {part1_result}")
     print(f"Part 2: {part2_result}")
@@ -17,4 +17,66 @@ def test_part2():
     from src.commons.file_parser import parse_input_file
     lines = parse_input_file('src/days/day3/demo.txt')
     result = solve_part2(lines)
-    assert result == 3121910778619
\ No newline at end of file
+    assert result == 3121910778619
+
+
+def test_k_digit_joltage():
+    """Test k-digit selection for several k on one bank."""
+    from src.days.day3.day3 import find_max_k_digit_joltage
+    assert find_max_k_digit_joltage('818181911112111', 1) == 9
+    assert find_max_k_digit_joltage('818181911112111', 2) == 92
+    assert find_max_k_digit_joltage('818181911112111', 5) == 92111
+    assert find_max_k_digit_joltage('818181911112111', 15) == 818181911112111
+    assert find_max_k_digit_joltage('818181911112111', 16) == 0
+    for k in (0, -1):
+        with pytest.raises(ValueError):
+            find_max_k_digit_joltage('818181911112111', k)
+
+
+def test_single_battery_bank(monkeypatch):
+    """Test that a one-digit bank keeps its digit as its part 1 joltage."""
+    from src.days.day3 import vectorized
+    from src.days.day3.day3 import find_max_joltage, find_max_12_digit_joltage
+    assert find_max_joltage('5') == 5
+    assert find_max_joltage(' 7 ') == 7
+    assert find_max_12_digit_joltage('5') == 0
+    lines = ['5', '', '12', '9']
+    assert solve_part1(lines) == 5 + 12 + 9
+    assert solve_part2(lines) == 0
+    monkeypatch.setattr(vectorized, 'HAS_NUMPY', False)
+    assert solve_part1(lines) == 5 + 12 + 9
+
+
+def test_bytes_fast_path():
+    """Test raw-bytes bank loading and its whole-file validation."""
+    from src.days.day3.day3 import load_banks, parse_banks, solve_part2_parsed
+    banks = load_banks('src/days/day3/demo.txt')
+    assert solve_part2_parsed(banks) == 3121910778619
+    assert parse_banks(b' 123 \r\n\n45\n') == (b'123', b'45')
+    for bad in (b'12a3\n', b'12 34\n', b'12\n3.4'):
+        with pytest.raises(ValueError):
+            parse_banks(bad)
+
+
+def test_vectorized_backend_matches_python(monkeypatch):
+    """Test batched NumPy selection against the monotonic stack on mixed lengths."""
+    pytest.importorskip('numpy')
+    import random
+    from src.days.day3 import vectorized
+    from src.days.day3.day3 import select_max_digits, solve_part2_parsed
+    rng = random.Random(23)
+    lengths = [rng.choice((3, 12, 15, 40)) for _ in range(300)]
+    banks = [bytes(rng.choice(b'0123456789') for _ in range(length))
+             for length in lengths]
+    monkeypatch.setattr(vectorized, 'BATCH_SIZE', 64)
+    for k in (1, 2, 12, 20):
+        expected = sum(select_max_digits(bank, k) for bank in banks)
+        assert vectorized.sum_max_digits(banks, k) == expected
+    for k in (0, -1):
+        with pytest.raises(ValueError):
+            vectorized.sum_max_digits(banks, k)
+        with pytest.raises(ValueError):
+            vectorized.select_max_digits_batch(vectorized.digit_matrix(banks[:1]), k)
+    expected = solve_part2_parsed(iter(banks))
+    monkeypatch.setattr(vectorized, 'HAS_NUMPY', False)
+    assert solve_part2_parsed(iter(banks)) == expected
@@ -0,0 +1,120 @@
+"""NumPy backend for Day 3 joltage selection across many banks at once.
+
+Banks are grouped by length into 2D uint8 digit matrices, and the greedy
+k-digit selection runs on every row of a matrix together: the i-th digit
+is the leftmost maximum of a window that ends at the same column for every
+row but starts just after each row's previous pick, so each step is one
+masked argmax over the matrix. Banks are consumed in fixed-size batches to
+bound memory on streamed input. NumPy is optional; check HAS_NUMPY before
+calling into this module.
+"""
+
+from itertools import islice
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Banks gathered per batch before grouping by length
+BATCH_SIZE = 1 << 16
+# Largest k whose k-digit values always fit in int64
+MAX_INT64_DIGITS = 18
+# Split point used to sum int64 values without overflowing
+SUM_SPLIT = 10 ** 9
+
+
+def digit_matrix(banks: list[bytes]) -> "np.ndarray":
+    """
+    Stack equal-length digit banks into a matrix of digit values.
+
+    Args:
+        banks: Validated ASCII digit banks, all of the same length
+
+    Returns:
+        uint8 array of shape (len(banks), bank length) holding values 0-9
+    """
+    flat = np.frombuffer(b''.join(banks), dtype=np.uint8)
+    return (flat - ord('0')).reshape(len(banks), -1)
+
+
+def select_max_digits_batch(digits: "np.ndarray", k: int) -> "np.ndarray":
+    """
+    Select the maximum k-digit number from every row of a digit matrix.
+
+    Args:
+        digits: Matrix from digit_matrix
+        k: Number of digits to select
+
+    Returns:
+        Array of selected values per row (int64, or object when k > 18);
+        zeros if the rows are shorter than k
+
+    Raises:
+        ValueError: If k is less than 1
+    """
+    if k < 1:
+        raise ValueError(f"Digit count must be at least 1: {k}")
+    rows, length = digits.shape
+    dtype = np.int64 if k <= MAX_INT64_DIGITS else object
+    values = np.zeros(rows, dtype=dtype)
+    if length < k or not rows:
+        return values
+
+    row_index = np.arange(rows)
+    starts = np.zeros(rows, dtype=np.intp)
+
+    for position in range(k):
+        # Every row must leave k - position - 1 digits after this pick
+        end = length - k + position + 1
+        low = int(starts.min())
+        window = digits[:, low:end]
+        columns = np.arange(low, end)
+        # Digits before a row's start can never win the argmax (int8 view so -1 fits)
+        masked = np.where(columns >= starts[:, None], window.view(np.int8), -1)
+        picks = masked.argmax(axis=1) + low
+        values = values * 10 + digits[row_index, picks].astype(dtype)
+        starts = picks + 1
+
+    return values
+
+
+def sum_values(values: "np.ndarray") -> int:
+    """Sum selected values as a Python int without int64 overflow."""
+    if values.dtype == object:
+        return int(values.sum())
+    high, low = np.divmod(values, SUM_SPLIT)
+    return int(high.sum()) * SUM_SPLIT + int(low.sum())
+
+
+def sum_max_digits(banks: Iterable[bytes], k: int) -> int:
+    """
+    Sum the maximum k-digit selections of all banks.
+
+    Args:
+        banks: Validated ASCII digit banks, e.g. from day3.parse_input
+        k: Number of digits to select
+
+    Returns:
+        Same total as summing day3.select_max_digits over the banks
+
+    Raises:
+        ValueError: If k is less than 1
+    """
+    if k < 1:
+        raise ValueError(f"Digit count must be at least 1: {k}")
+    total = 0
+    banks = iter(banks)
+
+    while batch := list(islice(banks, BATCH_SIZE)):
+        groups = {}
+        for bank in batch:
+            groups.setdefault(len(bank), []).append(bank)
+        for length, group in groups.items():
+            if length >= k:
+                total += sum_values(select_max_digits_batch(digit_matrix(group), k))
+
+    return total
@@ -0,0 +1 @@
+"""Day 4 challenge solution."""
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""Bit-packed pure-Python backend for Day 4 neighbour counting.
+
+Each grid row is a Python int with bit c set when column c holds a roll.
+The eight neighbour masks of a row are shifted copies of the rows above,
+at and below it, and a carry-save adder tree sums them into four bit-planes
+holding every column's neighbour count at once. Accessibility tests and
+removals are then plain bitwise operations on whole rows, with no NumPy.
+"""
+
+# Convert 0/1 cell bytes to ASCII binary digits, as used by int(..., 2)
+CELL_TO_BIT = bytes.maketrans(b'\x00\x01', b'01')
+
+
+def _full_add(a: int, b: int, c: int) -> tuple[int, int]:
+    """Add three bit vectors, returning (sum, carry) bit vectors."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+def neighbour_count_planes(above: int, row: int, below: int,
+                           mask: int) -> tuple[int, int, int, int]:
+    """
+    Count the 8 neighbours of every column of a row in bit-sliced form.
+
+    Args:
+        above: Bits of the row above (0 at the top edge)
+        row: Bits of the row itself
+        below: Bits of the row below (0 at the bottom edge)
+        mask: All-ones mask of the row width
+
+    Returns:
+        tuple: (bit0, bit1, bit2, bit3) planes of each column's count
+    """
+    # Shifting left moves column c to c + 1, so it is the neighbour of c + 1
+    s1, c1 = _full_add((above << 1) & mask, above, above >> 1)
+    s2, c2 = _full_add((below << 1) & mask, below, below >> 1)
+    left = (row << 1) & mask
+    right = row >> 1
+    s3, c3 = left ^ right, left & right
+
+    bit0, c4 = _full_add(s1, s2, s3)
+    t1, k1 = _full_add(c1, c2, c3)
+    bit1, k2 = t1 ^ c4, t1 & c4
+    return bit0, bit1, k1 ^ k2, k1 & k2
+
+
+def count_at_least(planes: tuple[int, int, int, int], threshold: int,
+                   mask: int) -> int:
+    """
+    Mark the columns whose bit-sliced count is at least a threshold.
+
+    Args:
+        planes: (bit0, bit1, bit2, bit3) planes from neighbour_count_planes
+        threshold: Value to compare against
+        mask: All-ones mask of the row width
+
+    Returns:
+        Bit vector with bit c set when the count of column c >= threshold
+    """
+    if threshold <= 0:
+        return mask
+    if threshold > 15:
+        return 0
+
+    greater = 0
+    equal = mask
+    for bit in (3, 2, 1, 0):
+        plane = planes[bit]
+        if threshold >> bit & 1:
+            equal &= plane
+        else:
+            greater |= equal & plane
+            equal &= ~plane
+    return greater | equal
+
+
+class BitGrid:
+    """Grid of rolls stored as one int bitset per row."""
+
+    def __init__(self, rows: list[int], cols: int):
+        """
+        Wrap row bitsets.
+
+        Args:
+            rows: One int per row, bit c set when column c holds a roll
+            cols: Number of columns
+        """
+        self.rows = rows
+        self.cols = cols
+        self.mask = (1 << cols) - 1
+
+    @classmethod
+    def from_padded_cells(cls, cells: bytes, rows: int, cols: int) -> 'BitGrid':
+        """
+        Build a bit grid from a flat padded grid (as built by day4.build_padded_grid).
+
+        Args:
+            cells: Flat padded grid with 1 for rolls, 0 elsewhere
+            rows: Number of grid rows, excluding padding
+            cols: Number of grid columns, excluding padding
+
+        Returns:
+            The equivalent BitGrid
+        """
+        width = cols + 2
+        row_bits = []
+        for row in range(rows):
+            base = (row + 1) * width + 1
+            # Reversed so that column c lands on bit c
+            bits = cells[base:base + cols][::-1].translate(CELL_TO_BIT)
+            row_bits.append(int(bits, 2) if cols else 0)
+        return cls(row_bits, cols)
+
+    def accessible_row(self, row: int, threshold: int = 4) -> int:
+        """
+        Return the bits of a row's rolls that have fewer than threshold neighbours.
+
+        Args:
+            row: Row index
+            threshold: A roll is accessible with fewer than this many neighbours
+
+        Returns:
+            Bit vector of accessible rolls in the row
+        """
+        above = self.rows[row - 1] if row > 0 else 0
+        below = self.rows[row + 1] if row + 1 < len(self.rows) else 0
+        planes = neighbour_count_planes(above, self.rows[row], below, self.mask)
+        return self.rows[row] & ~count_at_least(planes, threshold, self.mask)
+
+    def count_accessible(self, threshold: int = 4) -> int:
+        """
+        Count accessible rolls across the whole grid.
+
+        Args:
+            threshold: A roll is accessible with fewer than this many neighbours
+
+        Returns:
+            Number of accessible paper rolls
+        """
+        return sum(self.accessible_row(row, threshold).bit_count()
+                   for row in range(len(self.rows)))
+
+    def peel(self, threshold: int = 4) -> list[int]:
+        """
+        Remove accessible rolls round by round, modifying the grid in place.
+
+        Only rows next to a row that changed in the previous round can gain
+        accessible rolls, so each round rescans just those rows.
+
+        Args:
+            threshold: A roll is accessible with fewer than this many neighbours
+
+        Returns:
+            Number of rolls removed in each round, in order
+        """
+        removed_per_round = []
+        dirty = range(len(self.rows))
+
+        while True:
+            # Compute every removal first so the round is simultaneous
+            removals = []
+            for row in dirty:
+                accessible = self.accessible_row(row, threshold)
+                if accessible:
+                    removals.append((row, accessible))
+
+            if not removals:
+                break
+
+            removed = 0
+            next_dirty = set()
+            for row, accessible in removals:
+                self.rows[row] &= ~accessible
+                removed += accessible.bit_count()
+                next_dirty.update((row - 1, row, row + 1))
+
+            removed_per_round.append(removed)
+            dirty = sorted(row for row in next_dirty if 0 <= row < len(self.rows))
+
+        return removed_per_round
@@ -4,6 +4,20 @@ This module contains solutions for counting accessible paper rolls
 based on adjacent roll density in the printing department grid.
 """
 
+import hashlib
+from typing import Callable, Iterable, MutableSequence
+
+from src.commons.checkpoint import Checkpointer
+from src.commons.grid import MappedGrid
+from src.commons.instrumentation import count, timed
+from src.days.day4 import vectorized
+from src.days.day4.bitgrid import CELL_TO_BIT, BitGrid
+
+# Maps '@' to 1 and every other byte to 0
+ROLL_TABLE = bytes(1 if byte == ord('@') else 0 for byte in range(256))
+# Convert ASCII binary digits back to 0/1 cell bytes when unpacking
+BIT_TO_CELL = bytes.maketrans(b'01', b'\x00\x01')
+
 
 def count_adjacent_rolls(grid: list[str], row: int, col: int) -> int:
     """
@@ -35,34 +49,6 @@ def count_adjacent_rolls(grid: list[str], row: int, col: int) -> int:
     return adjacent_count
 
 
-def solve_part1(input_lines: list[str]) -> int:
-    """
-    Solve Part 1 of Day 4: Count accessible paper rolls.
-    
-    A paper roll is accessible if there are fewer than four rolls 
-    in the eight adjacent positions.
-    
-    Args:
-        input_lines: List of strings representing the grid
-        
-    Returns:
-        Number of accessible paper rolls
-    """
-    if not input_lines:
-        return 0
-    
-    accessible_count = 0
-    
-    for row in range(len(input_lines)):
-        for col in range(len(input_lines[0])):
-            if input_lines[row][col] == '@':
-                adjacent_rolls = count_adjacent_rolls(input_lines, row, col)
-                if adjacent_rolls < 4:
-                    accessible_count += 1
-    
-    return accessible_count
-
-
 def count_adjacent_rolls_with_edges(grid: list[list[str]], row: int, col: int) -> int:
     """
     Count the number of paper rolls in adjacent positions within grid bounds.
@@ -117,58 +103,425 @@ def find_accessible_rolls(grid: list[list[str]]) -> list[tuple[int, int]]:
     return accessible_rolls
 
 
-def solve_part2(input_lines: list[str]) -> int:
+def row_bytes(line: str | bytes | memoryview) -> bytes:
     """
-    Solve Part 2 of Day 4: Count total removable rolls through iterative removal.
+    Return a grid row as ASCII bytes.
     
-    Rolls are repeatedly removed if they have fewer than 4 adjacent rolls,
-    counting edge positions as empty. Process continues until no more rolls
-    are accessible.
+    Args:
+        line: Row as a string or a bytes-like object (e.g. a MappedGrid row)
+        
+    Returns:
+        The row's cell bytes
+    """
+    return line.encode('ascii') if isinstance(line, str) else bytes(line)
+
+
+def build_padded_grid(
+        input_lines: list[str] | MappedGrid) -> tuple[bytearray, int, int]:
+    """
+    Load the grid into a flat bytearray with a one-cell empty border.
+    
+    Cell (row, col) lives at index (row + 1) * (cols + 2) + col + 1 and holds
+    1 for a paper roll, 0 otherwise. The border removes all bounds checks from
+    neighbour lookups.
     
     Args:
-        input_lines: List of strings representing the grid
+        input_lines: List of strings or a MappedGrid representing the grid
         
     Returns:
-        Total number of rolls that can be removed
+        tuple: (cells, rows, cols) where cells is the padded flat grid
+    """
+    rows = len(input_lines)
+    cols = len(input_lines[0]) if rows else 0
+    width = cols + 2
+    
+    cells = bytearray((rows + 2) * width)
+    for row, line in enumerate(input_lines):
+        base = (row + 1) * width + 1
+        cells[base:base + cols] = row_bytes(line[:cols]).translate(ROLL_TABLE)
+    
+    return cells, rows, cols
+
+
+def compute_neighbour_counts(cells: bytearray, width: int) -> bytearray:
+    """
+    Count rolls in the 8 adjacent positions of every roll in a padded grid.
+    
+    Args:
+        cells: Padded flat grid from build_padded_grid
+        width: Row width of the padded grid (cols + 2)
+        
+    Returns:
+        Flat array of neighbour counts, 0 for cells without a roll
+    """
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+    counts = bytearray(len(cells))
+    
+    for index, cell in enumerate(cells):
+        if cell:
+            counts[index] = sum(cells[index + offset] for offset in offsets)
+    
+    return counts
+
+
+def count_accessible_cells(cells: bytes, cols: int, threshold: int = 4) -> int:
+    """
+    Count accessible rolls in a padded flat grid.
+    
+    Args:
+        cells: Padded flat grid from build_padded_grid
+        cols: Number of grid columns, excluding padding
+        threshold: A roll is accessible with fewer than this many neighbours
+        
+    Returns:
+        Number of accessible paper rolls
+    """
+    counts = compute_neighbour_counts(cells, cols + 2)
+    
+    accessible_count = 0
+    for index, cell in enumerate(cells):
+        if cell and counts[index] < threshold:
+            accessible_count += 1
+    
+    return accessible_count
+
+
+def peel_cells(cells: bytearray, cols: int, threshold: int = 4,
+               on_round: Callable[[int, bytearray], None] | None = None,
+               rounds: MutableSequence[int] | None = None) -> list[int]:
+    """
+    Remove accessible rolls round by round, touching only affected neighbours.
+    
+    Neighbour counts are computed once into a flat array. Each round removes
+    the current frontier and decrements the counts of its surviving
+    neighbours; a neighbour joins the next frontier the moment its count
+    drops below the threshold, as in k-core peeling. Total work is O(R x C).
+    
+    Args:
+        cells: Padded flat grid from build_padded_grid, modified in place
+        cols: Number of grid columns, excluding padding
+        threshold: A roll is accessible with fewer than this many neighbours
+        on_round: Optional callback receiving (removed, cells) after each round
+        rounds: Optional array the size of cells; each removed roll's entry
+                is set to its 1-based removal round
+        
+    Returns:
+        Number of rolls removed in each round, in order
     """
-    if not input_lines:
-        return 0
+    width = cols + 2
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
     
-    # Convert to mutable grid
-    grid = [list(line) for line in input_lines]
-    total_removed = 0
+    counts = compute_neighbour_counts(cells, width)
+    frontier = [index for index, cell in enumerate(cells)
+                if cell and counts[index] < threshold]
+    
+    removed_per_round = []
+    
+    while frontier:
+        # Remove the whole round first so removals within it are simultaneous
+        for index in frontier:
+            cells[index] = 0
+        removed_per_round.append(len(frontier))
+        
+        if rounds is not None:
+            for index in frontier:
+                rounds[index] = len(removed_per_round)
+        
+        next_frontier = []
+        for index in frontier:
+            for offset in offsets:
+                neighbour = index + offset
+                if cells[neighbour]:
+                    counts[neighbour] -= 1
+                    # Exactly one decrement crosses the threshold
+                    if counts[neighbour] == threshold - 1:
+                        next_frontier.append(neighbour)
+        
+        frontier = next_frontier
+        
+        if on_round is not None:
+            on_round(removed_per_round[-1], cells)
+    
+    count('day4.rounds', len(removed_per_round))
+    return removed_per_round
+
+
+def peel_rolls(input_lines: list[str] | MappedGrid, threshold: int = 4) -> list[int]:
+    """
+    Remove accessible rolls round by round with the frontier engine.
+    
+    Args:
+        input_lines: List of strings or a MappedGrid representing the grid
+        threshold: A roll is accessible with fewer than this many neighbours
+        
+    Returns:
+        Number of rolls removed in each round, in order
+    """
+    if not len(input_lines):
+        return []
+    
+    cells, _, cols = build_padded_grid(input_lines)
+    return peel_cells(cells, cols, threshold)
+
+
+def pack_cells(cells: bytes) -> bytes:
+    """
+    Pack 0/1 cell bytes into a bitmap, one bit per cell.
+    
+    Args:
+        cells: Flat grid of 0/1 bytes
+        
+    Returns:
+        Packed bitmap
+    """
+    # A leading 1 bit keeps leading empty cells from being dropped
+    value = int(b'1' + bytes(cells).translate(CELL_TO_BIT), 2)
+    return value.to_bytes((value.bit_length() + 7) // 8, 'big')
+
+
+def unpack_cells(bitmap: bytes, size: int) -> bytearray:
+    """
+    Unpack a bitmap from pack_cells back into 0/1 cell bytes.
     
-    while True:
-        # Find all currently accessible rolls
-        accessible_rolls = find_accessible_rolls(grid)
+    Args:
+        bitmap: Packed bitmap
+        size: Number of cells that were packed
         
-        # No more accessible rolls, stop
-        if not accessible_rolls:
-            break
+    Returns:
+        Flat grid of 0/1 bytes
         
-        # Remove all accessible rolls
-        for row, col in accessible_rolls:
-            grid[row][col] = '.'
+    Raises:
+        ValueError: If the bitmap does not hold exactly size cells
+    """
+    bits = bin(int.from_bytes(bitmap, 'big'))[3:]
+    if len(bits) != size:
+        raise ValueError(f"Bitmap holds {len(bits)} cells, expected {size}")
+    return bytearray(bits.encode('ascii').translate(BIT_TO_CELL))
+
+
+def grid_fingerprint(grid: tuple[bytes, int, int], threshold: int = 4) -> bytes:
+    """
+    Digest identifying a grid and threshold, used to match checkpoints.
+    
+    Args:
+        grid: (cells, rows, cols) from parse_input
+        threshold: Accessibility threshold
         
-        total_removed += len(accessible_rolls)
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    cells, rows, cols = grid
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{rows}x{cols}:{threshold}:".encode('ascii'))
+    digest.update(cells)
+    return digest.digest()
+
+
+def peel_resumable(grid: tuple[bytes, int, int], checkpointer: Checkpointer,
+                   threshold: int = 4) -> int:
+    """
+    Run the part 2 peeling with periodic checkpoints between rounds.
     
+    At each round boundary the remaining grid fully determines the rest of
+    the run, so the checkpoint stores the packed grid bitmap plus the
+    running total_removed. Resuming recomputes the neighbour counts from
+    the restored grid and continues with identical results. The checkpoint
+    file is removed once the run completes.
+    
+    Args:
+        grid: (cells, rows, cols) from parse_input
+        checkpointer: Checkpointer whose fingerprint came from grid_fingerprint
+        threshold: A roll is accessible with fewer than this many neighbours
+        
+    Returns:
+        Total number of rolls that can be removed
+    """
+    cells, _, cols = grid
+    state = checkpointer.load()
+    
+    if state is None:
+        total_removed = 0
+        cells = bytearray(cells)
+    else:
+        (total_removed,), bitmap = state
+        cells = unpack_cells(bitmap, len(cells))
+    
+    def save_round(removed: int, current_cells: bytearray) -> None:
+        nonlocal total_removed
+        total_removed += removed
+        if checkpointer.due():
+            checkpointer.save([total_removed], pack_cells(current_cells))
+    
+    peel_cells(cells, cols, threshold, on_round=save_round)
+    checkpointer.clear()
     return total_removed
 
 
+@timed('day4.parse')
+def parse_input(input_lines: Iterable[str] | MappedGrid) -> tuple[bytes, int, int]:
+    """
+    Parse the puzzle input into the model shared by both parts.
+    
+    Args:
+        input_lines: Iterable of strings or a MappedGrid representing the grid
+        
+    Returns:
+        tuple: (cells, rows, cols) with the padded flat grid as immutable bytes
+    """
+    if not isinstance(input_lines, MappedGrid):
+        input_lines = list(input_lines)
+    
+    cells, rows, cols = build_padded_grid(input_lines)
+    count('day4.cells', rows * cols)
+    return bytes(cells), rows, cols
+
+
+@timed('day4.part1')
+def solve_part1_parsed(grid: tuple[bytes, int, int]) -> int:
+    """
+    Solve Part 1 of Day 4 from a pre-parsed padded grid.
+    
+    Args:
+        grid: (cells, rows, cols) from parse_input
+        
+    Returns:
+        Number of accessible paper rolls
+    """
+    cells, rows, cols = grid
+    
+    if vectorized.HAS_NUMPY:
+        padded = vectorized.from_padded_cells(cells, rows, cols)
+        return vectorized.count_accessible(padded)
+    
+    return BitGrid.from_padded_cells(cells, rows, cols).count_accessible()
+
+
+@timed('day4.part2')
+def solve_part2_parsed(grid: tuple[bytes, int, int]) -> int:
+    """
+    Solve Part 2 of Day 4 from a pre-parsed padded grid.
+    
+    Args:
+        grid: (cells, rows, cols) from parse_input
+        
+    Returns:
+        Total number of rolls that can be removed
+    """
+    cells, rows, cols = grid
+    
+    if vectorized.HAS_NUMPY:
+        padded = vectorized.from_padded_cells(cells, rows, cols)
+        return sum(vectorized.peel_padded(padded))
+    
+    return sum(BitGrid.from_padded_cells(cells, rows, cols).peel())
+
+
+def solve_part1(input_lines: list[str] | MappedGrid) -> int:
+    """
+    Solve Part 1 of Day 4: Count accessible paper rolls.
+    
+    A paper roll is accessible if there are fewer than four rolls 
+    in the eight adjacent positions.
+    
+    Args:
+        input_lines: List of strings or a MappedGrid representing the grid
+        
+    Returns:
+        Number of accessible paper rolls
+    """
+    if isinstance(input_lines, MappedGrid) and vectorized.HAS_NUMPY:
+        # Reads the mapping through a strided view, with no intermediate copies
+        with timed('day4.part1'):
+            return vectorized.solve_part1(input_lines)
+    
+    return solve_part1_parsed(parse_input(input_lines))
+
+
+def solve_part2(input_lines: list[str] | MappedGrid) -> int:
+    """
+    Solve Part 2 of Day 4: Count total removable rolls through iterative removal.
+    
+    Rolls are repeatedly removed if they have fewer than 4 adjacent rolls,
+    counting edge positions as empty. Process continues until no more rolls
+    are accessible.
+    
+    Args:
+        input_lines: List of strings or a MappedGrid representing the grid
+        
+    Returns:
+        Total number of rolls that can be removed
+    """
+    if isinstance(input_lines, MappedGrid) and vectorized.HAS_NUMPY:
+        with timed('day4.part2'):
+            return sum(vectorized.peel_rolls(input_lines))
+    
+    return solve_part2_parsed(parse_input(input_lines))
+
+
 def main():
     """Main function to run the solution."""
+    import argparse
     import sys
-    from src.commons.file_parser import parse_input_file
+    from src.commons.checkpoint import DEFAULT_INTERVAL, CheckpointError
+    from src.commons.file_parser import InputFileError
 
-    if len(sys.argv) != 2:
-        print("Usage: python day4.py <input_file>")
+    parser = argparse.ArgumentParser(prog='python day4.py')
+    parser.add_argument('input_file')
+    parser.add_argument('--checkpoint', help='Save part 2 progress to this file')
+    parser.add_argument('--checkpoint-interval', type=float, default=DEFAULT_INTERVAL,
+                        help='Seconds between checkpoints (default: 60)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue part 2 from the checkpoint file')
+    parser.add_argument('--tiled', action='store_true',
+                        help='Process the grid from disk in row bands '
+                             '(for grids larger than memory)')
+    parser.add_argument('--band-rows', type=int, default=1024,
+                        help='With --tiled, grid rows per band (default: 1024)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='With --tiled, worker processes for bands (default: 1)')
+    args = parser.parse_args()
+    
+    filename = args.input_file
+    if args.tiled:
+        from src.days.day4.tiled import count_accessible_tiled, peel_tiled
+        try:
+            part1_result = count_accessible_tiled(filename, band_rows=args.band_rows)
+            part2_result = peel_tiled(filename, band_rows=args.band_rows,
+                                      workers=args.workers)
+        except InputFileError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Part 1: {part1_result}")
+        print(f"Part 2: {part2_result}")
+        return
+    
+    try:
+        grid = MappedGrid(filename)
+    except InputFileError as e:
+        print(f"Error: {e}")
         sys.exit(1)
     
-    filename = sys.argv[1]
-    lines = parse_input_file(filename)
+    with grid:
+        if vectorized.HAS_NUMPY and not args.checkpoint:
+            print(f"Part 1: {solve_part1(grid)}")
+            print(f"Part 2: {solve_part2(grid)}")
+            return
+        parsed = parse_input(grid)
+    
+    part1_result = solve_part1_parsed(parsed)
     
-    part1_result = solve_part1(lines)
-    part2_result = solve_part2(lines)
+    if args.checkpoint:
+        checkpointer = Checkpointer(args.checkpoint, 'day4.part2',
+                                    grid_fingerprint(parsed),
+                                    interval=args.checkpoint_interval,
+                                    resume=args.resume)
+        try:
+            part2_result = peel_resumable(parsed, checkpointer)
+        except CheckpointError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    else:
+        part2_result = solve_part2_parsed(parsed)
     
     print(f"Part 1: {part1_result}")
     print(f"Part 2: {part2_result}")
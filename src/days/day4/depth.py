@@ -0,0 +1,148 @@
+"""Peel-depth map for Day 4: removal rounds and core numbers for every roll.
+
+Peeling at threshold t (remove rolls with fewer than t neighbours, repeat)
+always leaves the t-core of the roll graph, whatever the removal order. So
+a single core decomposition, giving each roll the largest threshold at which
+it survives, answers "how many rolls are removable at threshold t" for all
+t at once. The per-roll removal round of the standard threshold comes from
+one frontier peel. Both maps are stored in compact arrays in the padded
+layout of build_padded_grid.
+"""
+
+from array import array
+
+from src.days.day4.day4 import compute_neighbour_counts, peel_cells
+
+# A roll has at most 8 neighbours, so core numbers fit in 0..8
+MAX_NEIGHBOURS = 8
+
+
+def core_numbers(cells: bytes, cols: int) -> bytearray:
+    """
+    Compute the core number of every roll with bucket-based k-core peeling.
+
+    Rolls are processed in order of current neighbour count using one
+    bucket per count; removing a roll decrements its live neighbours and
+    re-buckets them. Stale bucket entries are skipped, so the whole pass is
+    O(R x C).
+
+    Args:
+        cells: Padded flat grid from build_padded_grid
+        cols: Number of grid columns, excluding padding
+
+    Returns:
+        Flat array where each roll holds the largest threshold at which it
+        is never removed, and cells without a roll hold 0
+    """
+    width = cols + 2
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+
+    degrees = compute_neighbour_counts(cells, width)
+    alive = bytearray(cells)
+    cores = bytearray(len(cells))
+
+    buckets = [[] for _ in range(MAX_NEIGHBOURS + 1)]
+    for index, cell in enumerate(cells):
+        if cell:
+            buckets[degrees[index]].append(index)
+
+    for level, bucket in enumerate(buckets):
+        # Decrements never go below level, so the bucket refills in place
+        while bucket:
+            index = bucket.pop()
+            if not alive[index] or degrees[index] != level:
+                continue
+            alive[index] = 0
+            cores[index] = level
+            for offset in offsets:
+                neighbour = index + offset
+                if alive[neighbour] and degrees[neighbour] > level:
+                    degrees[neighbour] -= 1
+                    buckets[degrees[neighbour]].append(neighbour)
+
+    return cores
+
+
+class PeelDepthMap:
+    """Per-roll core numbers and removal rounds from one decomposition."""
+
+    def __init__(self, grid: tuple[bytes, int, int], threshold: int = 4):
+        """
+        Decompose a parsed grid.
+
+        Args:
+            grid: (cells, rows, cols) from day4.parse_input
+            threshold: Threshold whose removal rounds are recorded
+        """
+        cells, self.rows, self.cols = grid
+        self.threshold = threshold
+        self._cells = bytes(cells)
+
+        self.cores = core_numbers(self._cells, self.cols)
+        self.rounds = array('I', [0]) * len(self._cells)
+        self.round_sizes = peel_cells(bytearray(self._cells), self.cols, threshold,
+                                      rounds=self.rounds)
+
+        self.core_histogram = [0] * (MAX_NEIGHBOURS + 1)
+        for index, cell in enumerate(self._cells):
+            if cell:
+                self.core_histogram[self.cores[index]] += 1
+
+    def _index(self, row: int, col: int) -> int:
+        """Return the padded index of a cell, checking its bounds."""
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f"Cell ({row}, {col}) is outside the grid")
+        return (row + 1) * (self.cols + 2) + col + 1
+
+    def core_number(self, row: int, col: int) -> int | None:
+        """
+        Return the largest threshold at which a roll is never removed.
+
+        Args:
+            row: Grid row
+            col: Grid column
+
+        Returns:
+            Core number of the roll, or None if the cell holds no roll
+        """
+        index = self._index(row, col)
+        return self.cores[index] if self._cells[index] else None
+
+    def removal_round(self, row: int, col: int) -> int:
+        """
+        Return the round in which a roll is removed at the recorded threshold.
+
+        Args:
+            row: Grid row
+            col: Grid column
+
+        Returns:
+            1-based removal round, or 0 if the cell is never removed or empty
+        """
+        return self.rounds[self._index(row, col)]
+
+    def removable(self, threshold: int) -> int:
+        """
+        Count rolls removed in total when peeling at any threshold.
+
+        A roll is removed exactly when its core number is below the threshold.
+
+        Args:
+            threshold: A roll is accessible with fewer than this many neighbours
+
+        Returns:
+            Total number of rolls that can be removed
+        """
+        return sum(self.core_histogram[:max(threshold, 0)])
+
+    def removed_by_round(self, round_number: int) -> int:
+        """
+        Count rolls removed in the first rounds at the recorded threshold.
+
+        Args:
+            round_number: Number of rounds to include
+
+        Returns:
+            Total number of rolls removed in rounds 1..round_number
+        """
+        return sum(self.round_sizes[:max(round_number, 0)])
@@ -17,4 +17,155 @@ def test_part2():
     from src.commons.file_parser import parse_input_file
     lines = parse_input_file('src/days/day4/demo.txt')
     result = solve_part2(lines)
-    assert result == 43
\ No newline at end of file
+    assert result == 43
+
+
+def test_peel_rounds_match_repeated_scans():
+    """Test per-round peeling counts against repeated full-grid scans."""
+    from src.commons.file_parser import parse_input_file
+    from src.days.day4.day4 import find_accessible_rolls, peel_rolls
+    lines = parse_input_file('src/days/day4/demo.txt')
+    grid = [list(line) for line in lines]
+    expected = []
+    while accessible := find_accessible_rolls(grid):
+        for row, col in accessible:
+            grid[row][col] = '.'
+        expected.append(len(accessible))
+    assert peel_rolls(lines) == expected
+
+
+def test_pure_python_fallback(monkeypatch):
+    """Test the pure-Python path when NumPy is unavailable."""
+    from src.commons.file_parser import parse_input_file
+    from src.days.day4 import vectorized
+    monkeypatch.setattr(vectorized, 'HAS_NUMPY', False)
+    lines = parse_input_file('src/days/day4/demo.txt')
+    assert solve_part1(lines) == 13
+    assert solve_part2(lines) == 43
+
+
+def test_vectorized_backend_matches_python():
+    """Test NumPy neighbour counting against the pure-Python peeling."""
+    pytest.importorskip('numpy')
+    from src.commons.file_parser import parse_input_file
+    from src.days.day4 import vectorized
+    from src.days.day4.day4 import peel_rolls
+    lines = parse_input_file('src/days/day4/demo.txt')
+    assert vectorized.solve_part1(lines) == 13
+    assert vectorized.peel_rolls(lines) == peel_rolls(lines)
+
+
+def test_mapped_grid_input(tmp_path, monkeypatch):
+    """Test both backends on a memory-mapped grid with CRLF line endings."""
+    from src.commons.grid import MappedGrid
+    from src.days.day4 import vectorized
+    demo = open('src/days/day4/demo.txt').read().splitlines()
+    path = tmp_path / 'grid.txt'
+    path.write_bytes('\r\n'.join(demo).encode())
+    with MappedGrid(str(path)) as grid:
+        assert (grid.rows, grid.cols) == (len(demo), len(demo[0]))
+        assert bytes(grid[-1]) == demo[-1].encode()
+        assert solve_part1(grid) == 13
+        assert solve_part2(grid) == 43
+        monkeypatch.setattr(vectorized, 'HAS_NUMPY', False)
+        assert solve_part1(grid) == 13
+        assert solve_part2(grid) == 43
+
+
+def test_mapped_grid_trailing_blank_lines(tmp_path):
+    """Test that trailing blank lines never count as grid rows."""
+    from src.commons.grid import MappedGrid
+    path = tmp_path / 'grid.txt'
+    contents = (b'@@@\n@@@', b'@@@\n@@@\n', b'@@@\n@@@\n\n\n\n',
+                b'@@@\r\n@@@\r\n\r\n\r\n')
+    for content in contents:
+        path.write_bytes(content)
+        with MappedGrid(str(path)) as grid:
+            assert (grid.rows, grid.cols) == (2, 3)
+            assert bytes(grid[-1]) == b'@@@'
+
+
+def test_peel_resumes_from_checkpoint(tmp_path):
+    """Test that a run interrupted after a checkpoint resumes to the same total."""
+    from src.commons.checkpoint import Checkpointer
+    from src.commons.file_parser import parse_input_file
+    from src.days.day4.day4 import grid_fingerprint, parse_input, peel_resumable
+
+    class Preempted(Exception):
+        pass
+
+    class PreemptingCheckpointer(Checkpointer):
+        def save(self, fields, blob=b''):
+            super().save(fields, blob)
+            raise Preempted
+
+    grid = parse_input(parse_input_file('src/days/day4/demo.txt'))
+    path = str(tmp_path / 'day4.ckpt')
+    with pytest.raises(Preempted):
+        preempting = PreemptingCheckpointer(path, 'day4.part2', grid_fingerprint(grid),
+                                            interval=0)
+        peel_resumable(grid, preempting)
+    resumed = Checkpointer(path, 'day4.part2', grid_fingerprint(grid), resume=True)
+    assert resumed.load()[0] == [13]
+    assert peel_resumable(grid, resumed) == 43
+    assert not (tmp_path / 'day4.ckpt').exists()
+
+
+def test_bitgrid_matches_flat_peeling():
+    """Test bit-packed neighbour counting against the flat-grid peeling engine."""
+    import random
+    from src.days.day4.bitgrid import BitGrid
+    from src.days.day4.day4 import (
+        build_padded_grid, count_accessible_cells, peel_cells
+    )
+    rng = random.Random(4)
+    lines = [''.join(rng.choice('@@.') for _ in range(37)) for _ in range(23)]
+    cells, rows, cols = build_padded_grid(lines)
+    grid = BitGrid.from_padded_cells(bytes(cells), rows, cols)
+    for threshold in (2, 4, 6):
+        expected = count_accessible_cells(bytes(cells), cols, threshold)
+        assert grid.count_accessible(threshold) == expected
+    assert grid.peel() == peel_cells(cells, cols)
+
+
+def test_peel_depth_map_answers_every_threshold():
+    """Test depth-map threshold and round queries against fresh peels."""
+    import random
+    from src.days.day4.day4 import build_padded_grid, peel_cells
+    from src.days.day4.depth import PeelDepthMap
+    rng = random.Random(21)
+    lines = [''.join(rng.choice('@@@.') for _ in range(29)) for _ in range(17)]
+    cells, rows, cols = build_padded_grid(lines)
+    depth = PeelDepthMap((bytes(cells), rows, cols))
+    for threshold in range(10):
+        expected = sum(peel_cells(bytearray(cells), cols, threshold))
+        assert depth.removable(threshold) == expected
+    round_sizes = peel_cells(bytearray(cells), cols)
+    assert depth.round_sizes == round_sizes
+    assert depth.removed_by_round(3) == sum(round_sizes[:3])
+    rounds = [depth.removal_round(row, col)
+              for row in range(rows) for col in range(cols)]
+    counts = [rounds.count(number) for number in range(1, len(round_sizes) + 1)]
+    assert counts == round_sizes
+    for row in range(rows):
+        for col in range(cols):
+            core = depth.core_number(row, col)
+            assert (core is None) == (lines[row][col] != '@')
+            assert core is None or (depth.removal_round(row, col) > 0) == (core < 4)
+
+
+def test_tiled_peeling_matches_in_memory(tmp_path):
+    """Test out-of-core banded peeling totals against the in-memory solver."""
+    import random
+    from src.days.day4.tiled import count_accessible_tiled, peel_tiled
+    rng = random.Random(22)
+    lines = [''.join(rng.choice('@@@.') for _ in range(31)) for _ in range(26)]
+    path = tmp_path / 'grid.txt'
+    path.write_text('\n'.join(lines) + '\n')
+    expected = solve_part2(lines)
+    assert peel_tiled(str(path), band_rows=3, work_dir=str(tmp_path)) == expected
+    result = peel_tiled(str(path), band_rows=4, workers=2, work_dir=str(tmp_path))
+    assert result == expected
+    assert peel_tiled('src/days/day4/demo.txt', band_rows=1) == 43
+    assert count_accessible_tiled(str(path), band_rows=4) == solve_part1(lines)
+    assert list(tmp_path.iterdir()) == [path]
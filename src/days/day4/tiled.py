@@ -0,0 +1,222 @@
+"""Out-of-core tiled execution of Day 4 for grids larger than memory.
+
+The input is converted once, row by row, into a padded 0/1 working file
+with the layout of build_padded_grid, and that file is memory-mapped. The
+grid is split into bands of rows; processing a band loads only its rows
+plus a one-row halo above and below, peels the band to a local fixpoint
+with the halo held fixed, and writes the band back. A band whose first or
+last row lost rolls marks its neighbour for another pass, and passes repeat
+until no band changes.
+
+Peeling always ends in the same k-core whatever the removal order, so the
+total matches the in-memory path. Bands alternate in a red-black pattern:
+even bands run together, then odd bands, so bands running at the same time
+never read rows another one is writing, and the worker processes share the
+working file through the page cache.
+"""
+
+import mmap
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from src.commons.grid import MappedGrid
+from src.commons.instrumentation import count, timed
+from src.days.day4.bitgrid import BitGrid
+from src.days.day4.day4 import ROLL_TABLE, build_padded_grid, row_bytes
+
+DEFAULT_BAND_ROWS = 1024
+
+
+def write_padded_grid(grid: MappedGrid, path: str) -> None:
+    """
+    Write a grid to disk as padded 0/1 cells, one row at a time.
+
+    Args:
+        grid: Memory-mapped input grid
+        path: Output file, laid out like build_padded_grid
+    """
+    border = bytes(grid.cols + 2)
+    with open(path, 'wb') as f:
+        f.write(border)
+        for row in range(grid.rows):
+            f.write(b'\x00' + row_bytes(grid.row(row)).translate(ROLL_TABLE) + b'\x00')
+        f.write(border)
+
+
+def peel_band(slab: bytearray, cols: int,
+              threshold: int = 4) -> tuple[int, bool, bool]:
+    """
+    Peel the interior rows of a slab to a fixpoint, keeping its halo rows fixed.
+
+    Args:
+        slab: Padded rows of one band with one halo row above and below,
+              modified in place
+        cols: Number of grid columns, excluding padding
+        threshold: A roll is accessible with fewer than this many neighbours
+
+    Returns:
+        tuple: (removed, first_row_changed, last_row_changed)
+    """
+    width = cols + 2
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+    # Interior cells lie between the halo rows
+    first, last = width, len(slab) - width
+
+    # Halo rows only contribute counts, so count the interior alone
+    counts = bytearray(len(slab))
+    for index in range(first, last):
+        if slab[index]:
+            counts[index] = sum(slab[index + offset] for offset in offsets)
+    frontier = [index for index in range(first, last)
+                if slab[index] and counts[index] < threshold]
+
+    removed = 0
+    first_row_changed = last_row_changed = False
+
+    while frontier:
+        for index in frontier:
+            slab[index] = 0
+        removed += len(frontier)
+        first_row_changed = first_row_changed or min(frontier) < 2 * width
+        last_row_changed = last_row_changed or max(frontier) >= last - width
+
+        next_frontier = []
+        for index in frontier:
+            for offset in offsets:
+                neighbour = index + offset
+                if first <= neighbour < last and slab[neighbour]:
+                    counts[neighbour] -= 1
+                    if counts[neighbour] == threshold - 1:
+                        next_frontier.append(neighbour)
+        frontier = next_frontier
+
+    return removed, first_row_changed, last_row_changed
+
+
+def process_band(path: str, cols: int, first_row: int, last_row: int,
+                 threshold: int = 4) -> tuple[int, bool, bool]:
+    """
+    Load one band of the working file, peel it and write it back.
+
+    Args:
+        path: Padded working file from write_padded_grid
+        cols: Number of grid columns, excluding padding
+        first_row: First grid row of the band
+        last_row: Grid row just past the band
+        threshold: A roll is accessible with fewer than this many neighbours
+
+    Returns:
+        tuple: (removed, first_row_changed, last_row_changed)
+    """
+    width = cols + 2
+    # Grid row r is padded row r + 1, so the halo rows are first_row and last_row + 1
+    start, stop = first_row * width, (last_row + 2) * width
+
+    with open(path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as cells:
+        slab = bytearray(cells[start:stop])
+        result = peel_band(slab, cols, threshold)
+        if result[0]:
+            cells[start + width:stop - width] = slab[width:-width]
+
+    return result
+
+
+@timed('day4.tiled')
+def count_accessible_tiled(filename: str, threshold: int = 4,
+                           band_rows: int = DEFAULT_BAND_ROWS) -> int:
+    """
+    Count accessible rolls of a grid file one band at a time.
+
+    Args:
+        filename: Path to the grid file
+        threshold: A roll is accessible with fewer than this many neighbours
+        band_rows: Grid rows per band
+
+    Returns:
+        Number of accessible paper rolls, as solve_part1 returns
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be read
+    """
+    total = 0
+    with MappedGrid(filename) as grid:
+        for first in range(0, grid.rows, band_rows):
+            last = min(first + band_rows, grid.rows)
+            top = max(first - 1, 0)
+            # Rows are copied so no views of the mapping outlive the band
+            bottom = min(last + 1, grid.rows)
+            lines = [row_bytes(grid.row(row)) for row in range(top, bottom)]
+            cells, rows, cols = build_padded_grid(lines)
+            band = BitGrid.from_padded_cells(cells, rows, cols)
+            total += sum(band.accessible_row(row, threshold).bit_count()
+                         for row in range(first - top, last - top))
+    return total
+
+
+@timed('day4.tiled')
+def peel_tiled(filename: str, threshold: int = 4, band_rows: int = DEFAULT_BAND_ROWS,
+               workers: int = 1, work_dir: str | None = None) -> int:
+    """
+    Count the total removable rolls of a grid file without loading it whole.
+
+    Args:
+        filename: Path to the grid file
+        threshold: A roll is accessible with fewer than this many neighbours
+        band_rows: Grid rows per band
+        workers: Worker processes for bands (1 runs them in this process)
+        work_dir: Directory for the working file (default: system temp dir)
+
+    Returns:
+        Total number of rolls that can be removed, as solve_part2 returns
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be read
+    """
+    with MappedGrid(filename) as grid:
+        rows, cols = grid.rows, grid.cols
+        if not rows or not cols:
+            return 0
+        fd, path = tempfile.mkstemp(suffix='.cells', dir=work_dir)
+        os.close(fd)
+        try:
+            write_padded_grid(grid, path)
+        except BaseException:
+            os.remove(path)
+            raise
+
+    bands = [(first, min(first + band_rows, rows))
+             for first in range(0, rows, band_rows)]
+    count('day4.bands', len(bands))
+
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    total = 0
+    try:
+        dirty = set(range(len(bands)))
+        while dirty:
+            for parity in (0, 1):
+                batch = sorted(band for band in dirty if band % 2 == parity)
+                dirty.difference_update(batch)
+                args = ([path] * len(batch), [cols] * len(batch),
+                        [bands[band][0] for band in batch],
+                        [bands[band][1] for band in batch],
+                        [threshold] * len(batch))
+                mapper = executor.map if executor else map
+                results = mapper(process_band, *args)
+                count('day4.band_passes', len(batch))
+
+                for band, outcome in zip(batch, results):
+                    removed, first_changed, last_changed = outcome
+                    total += removed
+                    if first_changed and band > 0:
+                        dirty.add(band - 1)
+                    if last_changed and band + 1 < len(bands):
+                        dirty.add(band + 1)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        os.remove(path)
+
+    return total
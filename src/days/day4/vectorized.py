@@ -0,0 +1,172 @@
+"""NumPy backend for Day 4 neighbour counting.
+
+Loads the grid into a zero-padded uint8 array and computes all 8-neighbour
+counts as a sum of shifted slices, so every round is a whole-array operation.
+NumPy is optional; check HAS_NUMPY before calling into this module.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+from src.commons.grid import MappedGrid
+from src.commons.instrumentation import count, timed
+
+HAS_NUMPY = np is not None
+
+
+@timed('day4.parse')
+def load_padded_grid(input_lines: list[str] | MappedGrid) -> "np.ndarray":
+    """
+    Load the grid into a padded uint8 array of roll flags.
+
+    A MappedGrid is read in place through a strided view of its buffer.
+
+    Args:
+        input_lines: List of strings or a MappedGrid representing the grid
+
+    Returns:
+        Array of shape (rows + 2, cols + 2) with 1 for rolls, 0 elsewhere
+    """
+    rows = len(input_lines)
+    cols = len(input_lines[0]) if rows else 0
+
+    if isinstance(input_lines, MappedGrid):
+        cells = np.ndarray((rows, cols), dtype=np.uint8,
+                           buffer=input_lines.buffer, strides=(input_lines.stride, 1))
+    else:
+        raw = ''.join(line[:cols] for line in input_lines).encode('ascii')
+        cells = np.frombuffer(raw, dtype=np.uint8).reshape(rows, cols)
+
+    padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    # Compare straight into the interior so no full-size temporary is made
+    np.equal(cells, ord('@'), out=padded[1:-1, 1:-1], casting='unsafe')
+    return padded
+
+
+def neighbour_counts(padded: "np.ndarray",
+                     out: "np.ndarray | None" = None) -> "np.ndarray":
+    """
+    Count rolls in the 8 adjacent positions of every interior cell.
+
+    Args:
+        padded: Padded roll-flag array from load_padded_grid
+        out: Optional uint8 (rows, cols) array to reuse for the result
+
+    Returns:
+        uint8 array of shape (rows, cols) with the neighbour counts
+    """
+    rows = padded.shape[0] - 2
+    cols = padded.shape[1] - 2
+    if out is None:
+        counts = np.zeros((rows, cols), dtype=np.uint8)
+    else:
+        counts = out
+        counts.fill(0)
+
+    for row_offset in (0, 1, 2):
+        for col_offset in (0, 1, 2):
+            if row_offset == 1 and col_offset == 1:
+                continue
+            counts += padded[row_offset:row_offset + rows,
+                             col_offset:col_offset + cols]
+
+    return counts
+
+
+def from_padded_cells(cells: bytes, rows: int, cols: int) -> "np.ndarray":
+    """
+    Copy a flat padded grid (as built by day4.build_padded_grid) into an array.
+
+    Args:
+        cells: Flat padded grid with 1 for rolls, 0 elsewhere
+        rows: Number of grid rows, excluding padding
+        cols: Number of grid columns, excluding padding
+
+    Returns:
+        Writable array of shape (rows + 2, cols + 2)
+    """
+    return np.frombuffer(cells, dtype=np.uint8).reshape(rows + 2, cols + 2).copy()
+
+
+def count_accessible(padded: "np.ndarray", threshold: int = 4) -> int:
+    """
+    Count accessible rolls in a padded roll-flag array.
+
+    Args:
+        padded: Padded roll-flag array
+        threshold: A roll is accessible with fewer than this many neighbours
+
+    Returns:
+        Number of accessible paper rolls
+    """
+    accessible = neighbour_counts(padded) < threshold
+    accessible &= padded[1:-1, 1:-1].view(bool)
+    return int(np.count_nonzero(accessible))
+
+
+def peel_padded(padded: "np.ndarray", threshold: int = 4) -> list[int]:
+    """
+    Remove accessible rolls round by round, clearing them in place.
+
+    Args:
+        padded: Padded roll-flag array, modified in place
+        threshold: A roll is accessible with fewer than this many neighbours
+
+    Returns:
+        Number of rolls removed in each round, in order
+    """
+    interior = padded[1:-1, 1:-1]
+    removed_per_round = []
+    # Buffers reused every round to keep peak memory flat
+    counts = np.empty(interior.shape, dtype=np.uint8)
+    accessible = np.empty(interior.shape, dtype=bool)
+
+    while True:
+        np.less(neighbour_counts(padded, out=counts), threshold, out=accessible)
+        accessible &= interior.view(bool)
+        removed = int(np.count_nonzero(accessible))
+        if not removed:
+            break
+
+        # interior is a view, so this clears the rolls inside padded as well
+        interior[accessible] = 0
+        removed_per_round.append(removed)
+
+    count('day4.rounds', len(removed_per_round))
+    return removed_per_round
+
+
+def solve_part1(input_lines: list[str] | MappedGrid, threshold: int = 4) -> int:
+    """
+    Count accessible rolls with whole-array operations.
+
+    Args:
+        input_lines: List of strings or a MappedGrid representing the grid
+        threshold: A roll is accessible with fewer than this many neighbours
+
+    Returns:
+        Number of accessible paper rolls
+    """
+    if not len(input_lines):
+        return 0
+
+    return count_accessible(load_padded_grid(input_lines), threshold)
+
+
+def peel_rolls(input_lines: list[str] | MappedGrid, threshold: int = 4) -> list[int]:
+    """
+    Remove accessible rolls round by round with whole-array operations.
+
+    Args:
+        input_lines: List of strings or a MappedGrid representing the grid
+        threshold: A roll is accessible with fewer than this many neighbours
+
+    Returns:
+        Number of rolls removed in each round, in order
+    """
+    if not len(input_lines):
+        return []
+
+    return peel_padded(load_padded_grid(input_lines), threshold)
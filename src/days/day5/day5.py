@@ -1,3 +1,14 @@
+from array import array
+from typing import Iterable, Iterator, Sequence
+
+from src.commons.instrumentation import count, timed
+from src.commons.int_array import pack_ints
+from src.commons.interval_index import CoverageIndex, IntervalIndex
+
+# Parsed model shared by both parts: (ranges, seeds)
+ParsedInput = tuple[tuple[tuple[int, int], ...], array | tuple[int, ...]]
+
+
 def parse_range(line: str) -> tuple[int, int]:
     """
     Parse a range instruction like '3-5' or '10-14'.
@@ -57,100 +68,220 @@ def parse_seed(line: str) -> int:
         raise ValueError(f"Invalid seed number: {line}")
 
 
-def parse_input_sections(lines: list[str]) -> tuple[list[tuple[int, int]], list[int]]:
+def split_input_sections(
+        lines: Iterable[str]) -> tuple[list[tuple[int, int]], Iterator[int]]:
     """
-    Parse the input into ranges and seeds sections.
+    Parse the ranges section eagerly and return the seeds section lazily.
+    
+    Ranges are read up to the first blank line. The remaining lines are
+    left unread and parsed one at a time as the returned iterator is
+    consumed, so seeds never need to be held in memory.
     
     Args:
-        lines: List of input lines
+        lines: Iterable of input lines, consumed once
         
     Returns:
         tuple: (ranges, seeds) where ranges is list of (start, end) tuples
-              and seeds is list of integers
+              and seeds is an iterator of integers
         
     Raises:
         ValueError: If input format is invalid
     """
+    line_iter = iter(lines)
     ranges = []
-    seeds = []
-    current_section = "ranges"
     
-    for line in lines:
+    for line in line_iter:
         line = line.strip()
-        
         if not line:
-            current_section = "seeds"
-            continue
+            break
+        ranges.append(parse_range(line))
+    
+    return ranges, _iter_seeds(line_iter)
+
+
+def _iter_seeds(line_iter: Iterator[str]) -> Iterator[int]:
+    """Yield parsed seeds from the remaining lines, skipping blank ones."""
+    for line in line_iter:
+        line = line.strip()
+        if line:
+            yield parse_seed(line)
+
+
+def parse_input_sections(
+        lines: Iterable[str]) -> tuple[list[tuple[int, int]], list[int]]:
+    """
+    Parse the input into ranges and seeds sections.
+    
+    Args:
+        lines: Iterable of input lines
+        
+    Returns:
+        tuple: (ranges, seeds) where ranges is list of (start, end) tuples
+              and seeds is list of integers
+        
+    Raises:
+        ValueError: If input format is invalid
+    """
+    ranges, seeds = split_input_sections(lines)
+    return ranges, list(seeds)
+
+
+def query_seeds_batch(ranges: list[tuple[int, int]],
+                      seeds: list[int]) -> tuple[list[bool], list[int]]:
+    """
+    Answer membership and overlap counts for all seeds in one sweep.
+    
+    Seeds are sorted once and merged against the sorted range starts and
+    ends, so the whole batch costs O((n + m) log(n + m)) instead of one
+    lookup per seed.
+    
+    Args:
+        ranges: List of (start, end) inclusive ranges
+        seeds: List of seed numbers, in any order
+        
+    Returns:
+        tuple: (covered, overlaps) aligned with seeds, where covered[i] is True
+              if seeds[i] lies in any range and overlaps[i] counts the ranges
+              containing seeds[i]
+    """
+    starts = sorted(start for start, _ in ranges)
+    ends = sorted(end for _, end in ranges)
+    
+    overlaps = [0] * len(seeds)
+    start_pos = 0
+    end_pos = 0
+    
+    for seed_index in sorted(range(len(seeds)), key=seeds.__getitem__):
+        seed = seeds[seed_index]
+        
+        # Ranges opened at or before the seed
+        while start_pos < len(starts) and starts[start_pos] <= seed:
+            start_pos += 1
+        # Ranges closed strictly before the seed
+        while end_pos < len(ends) and ends[end_pos] < seed:
+            end_pos += 1
         
-        if current_section == "ranges":
-            ranges.append(parse_range(line))
-        else:
-            seeds.append(parse_seed(line))
+        overlaps[seed_index] = start_pos - end_pos
     
-    return ranges, seeds
+    covered = [count > 0 for count in overlaps]
+    return covered, overlaps
 
 
-def solve_part1(lines: list[str]) -> int:
+@timed('day5.parse')
+def parse_input(lines: Iterable[str]) -> ParsedInput:
     """
-    Solve Part 1 of Day 5 puzzle.
+    Parse the puzzle input into the model shared by both parts.
     
     Args:
-        lines: List of input lines
+        lines: Iterable of input lines
+        
+    Returns:
+        tuple: (ranges, seeds) where ranges is a tuple of (start, end) tuples
+              and seeds is an array('q') of seed numbers, or a tuple when
+              a seed does not fit in 64 bits
+        
+    Raises:
+        ValueError: If input format is invalid
+    """
+    ranges, seeds = split_input_sections(lines)
+    seeds = pack_ints(seeds)
+    count('day5.ranges', len(ranges))
+    count('day5.seeds', len(seeds))
+    return tuple(ranges), seeds
+
+
+@timed('day5.part1')
+def solve_part1_parsed(parsed: tuple[Sequence[tuple[int, int]], Iterable[int]]) -> int:
+    """
+    Solve Part 1 of Day 5 from pre-parsed ranges and seeds.
+    
+    Args:
+        parsed: (ranges, seeds) from parse_input or split_input_sections
         
     Returns:
         int: Result for part 1
     """
-    ranges, seeds = parse_input_sections(lines)
+    ranges, seeds = parsed
+    index = IntervalIndex(ranges)
     
     result = 0
     for seed in seeds:
-        for range_start, range_end in ranges:
-            if range_start <= seed <= range_end:
-                result += 1
-                break
+        if index.contains(seed):
+            result += 1
     
     return result
 
 
-def solve_part2(lines: list[str]) -> int:
+@timed('day5.part2')
+def solve_part2_parsed(parsed: tuple[Sequence[tuple[int, int]], Iterable[int]]) -> int:
     """
-    Solve Part 2 of Day 5 puzzle.
+    Solve Part 2 of Day 5 from pre-parsed ranges and seeds.
     
     Args:
-        lines: List of input lines
+        parsed: (ranges, seeds) from parse_input or split_input_sections
         
     Returns:
         int: Result for part 2
     """
-    ranges, seeds = parse_input_sections(lines)
+    ranges, seeds = parsed
+    coverage = CoverageIndex(ranges)
     
     result = 0
     for seed in seeds:
-        overlaps = 0
-        for range_start, range_end in ranges:
-            if range_start <= seed <= range_end:
-                overlaps += 1
-        
-        if overlaps >= 2:
+        if coverage.covered_at_least(seed, 2):
             result += 1
     
     return result
 
 
+def solve_part1(lines: Iterable[str]) -> int:
+    """
+    Solve Part 1 of Day 5 puzzle.
+    
+    Args:
+        lines: Iterable of input lines, consumed once
+        
+    Returns:
+        int: Result for part 1
+    """
+    with timed('day5.parse'):
+        parsed = split_input_sections(lines)
+    return solve_part1_parsed(parsed)
+
+
+def solve_part2(lines: Iterable[str]) -> int:
+    """
+    Solve Part 2 of Day 5 puzzle.
+    
+    Args:
+        lines: Iterable of input lines, consumed once
+        
+    Returns:
+        int: Result for part 2
+    """
+    with timed('day5.parse'):
+        parsed = split_input_sections(lines)
+    return solve_part2_parsed(parsed)
+
+
 def main():
     """Main function to run the solution."""
     import sys
-    from src.commons.file_parser import parse_input_file
+    from src.commons.file_parser import InputFileError, load_parsed_input
 
     if len(sys.argv) != 2:
         print("Usage: python -m src.days.day5.day5 <input_file>")
         sys.exit(1)
     
     filename = sys.argv[1]
-    lines = parse_input_file(filename)
+    try:
+        parsed = load_parsed_input(filename, parse_input)
+    except InputFileError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     
-    part1_result = solve_part1(lines)
-    part2_result = solve_part2(lines)
+    part1_result = solve_part1_parsed(parsed)
+    part2_result = solve_part2_parsed(parsed)
     
     print(f"Part 1: {part1_result}")
     print(f"Part 2: {part2_result}")
@@ -9,7 +9,7 @@ def test_part1():
     from src.commons.file_parser import parse_input_file
     lines = parse_input_file('src/days/day5/demo.txt')
     result = solve_part1(lines)
-    assert result == 0
+    assert result == 3
 
 
 def test_part2():
@@ -17,4 +17,108 @@ def test_part2():
     from src.commons.file_parser import parse_input_file
     lines = parse_input_file('src/days/day5/demo.txt')
     result = solve_part2(lines)
-    assert result == 0
\ No newline at end of file
+    assert result == 1
+
+
+def test_interval_indices_match_linear_scan():
+    """Test interval index lookups against a linear scan over the ranges."""
+    from src.commons.interval_index import CoverageIndex, IntervalIndex
+    ranges = [(3, 5), (10, 14), (16, 20), (12, 18), (6, 6), (30, 30)]
+    index = IntervalIndex(ranges)
+    coverage = CoverageIndex(ranges)
+    for point in range(0, 35):
+        overlaps = sum(1 for start, end in ranges if start <= point <= end)
+        assert index.contains(point) == (overlaps > 0)
+        assert coverage.depth(point) == overlaps
+
+
+def test_batch_query_matches_solvers():
+    """Test batch sweep results against the per-seed solvers."""
+    from src.commons.file_parser import parse_input_file
+    from src.days.day5.day5 import parse_input_sections, query_seeds_batch
+    lines = parse_input_file('src/days/day5/demo.txt')
+    ranges, seeds = parse_input_sections(lines)
+    covered, overlaps = query_seeds_batch(ranges, seeds[::-1])
+    assert sum(covered) == solve_part1(lines)
+    assert sum(1 for count in overlaps if count >= 2) == solve_part2(lines)
+    assert overlaps == [0, 2, 1, 0, 1, 0]
+
+
+def test_streaming_input():
+    """Test solving directly from the lazy line iterator."""
+    from src.commons.file_parser import iter_input_lines
+    assert solve_part1(iter_input_lines('src/days/day5/demo.txt')) == 3
+    assert solve_part2(iter_input_lines('src/days/day5/demo.txt')) == 1
+
+
+def test_parsed_input_is_shared():
+    """Test that both parts run from one cached parse of the file within a scope."""
+    from src.commons.file_parser import load_parsed_input, parse_scope
+    from src.days.day5.day5 import parse_input, solve_part1_parsed, solve_part2_parsed
+    with parse_scope():
+        parsed = load_parsed_input('src/days/day5/demo.txt', parse_input)
+        assert load_parsed_input('src/days/day5/demo.txt', parse_input) is parsed
+    assert load_parsed_input('src/days/day5/demo.txt', parse_input) is not parsed
+    assert solve_part1_parsed(parsed) == 3
+    assert solve_part2_parsed(parsed) == 1
+
+
+def test_interval_store_online_updates():
+    """Test IntervalStore coverage through adds and removes against a linear scan."""
+    import random
+    from src.commons.interval_index import IntervalStore
+    rng = random.Random(5)
+    ranges = [(3, 5), (10, 14), (12, 18)]
+    store = IntervalStore.from_ranges(ranges)
+    for _ in range(200):
+        if ranges and rng.random() < 0.4:
+            start, end = ranges.pop(rng.randrange(len(ranges)))
+            store.remove_range(start, end)
+        else:
+            start = rng.randrange(40)
+            end = start + rng.randrange(8)
+            ranges.append((start, end))
+            store.add_range(start, end)
+        point = rng.randrange(-1, 50)
+        overlaps = sum(1 for start, end in ranges if start <= point <= end)
+        assert store.coverage(point) == overlaps
+        assert (point in store) == (overlaps > 0)
+    assert len(store) == len(ranges)
+    with pytest.raises(ValueError):
+        store.remove_range(100, 101)
+
+
+def test_blocked_sorted_list_small_blocks(monkeypatch):
+    """Test block splits and empty-block removal against a plain sorted list."""
+    import random
+    from src.commons import interval_index
+    monkeypatch.setattr(interval_index, 'BLOCK_SIZE', 2)
+    rng = random.Random(7)
+    expected = sorted(rng.randrange(30) for _ in range(10))
+    values = interval_index.BlockedSortedList(expected)
+    for _ in range(500):
+        if expected and rng.random() < 0.45:
+            value = expected.pop(rng.randrange(len(expected)))
+            values.remove(value)
+        else:
+            value = rng.randrange(30)
+            expected.append(value)
+            expected.sort()
+            values.add(value)
+        probe = rng.randrange(-1, 32)
+        assert values.count_less(probe) == sum(1 for v in expected if v < probe)
+        assert values.count_at_most(probe) == sum(1 for v in expected if v <= probe)
+        assert len(values) == len(expected)
+    with pytest.raises(ValueError):
+        values.remove(100)
+
+
+def test_seeds_beyond_int64():
+    """Test that IDs too large for 64 bits still parse and match."""
+    from src.days.day5.day5 import parse_input, solve_part1_parsed
+    lines = ['1-100000000000000000000', '', '5',
+             '99999999999999999999', '100000000000000000001']
+    parsed = parse_input(lines)
+    assert parsed[1] == (5, 99999999999999999999, 100000000000000000001)
+    assert solve_part1_parsed(parsed) == 2
+    assert solve_part1(lines) == 2
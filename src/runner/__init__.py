@@ -0,0 +1 @@
+"""Multi-day batch runner for Advent of Code 2025 solutions."""
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""Command-line entry point: python -m src.runner --day 4 input1.txt input2.txt."""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from src.runner.ingest import DEFAULT_CONCURRENCY, ingest_jobs
+from src.runner.pool import run_jobs
+from src.runner.registry import PARTS, discover_solvers
+
+
+def parse_job(spec: str, default_day: int | None) -> tuple[int, str]:
+    """
+    Parse a job spec of the form 'DAY:PATH', or a bare PATH with --day.
+
+    Args:
+        spec: Job spec from the command line
+        default_day: Day used for bare paths
+
+    Returns:
+        tuple: (day, filename)
+
+    Raises:
+        ValueError: If no day can be determined
+    """
+    day_text, separator, filename = spec.partition(':')
+    if separator and day_text.isdigit():
+        return int(day_text), filename
+    if default_day is None:
+        raise ValueError(f"No day given for '{spec}' (use --day or DAY:PATH)")
+    return default_day, spec
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run all jobs and stream results to stdout as JSON lines."""
+    parser = argparse.ArgumentParser(prog='python -m src.runner',
+                                     description='Run solvers over many input files.')
+    parser.add_argument('jobs', nargs='+', metavar='[DAY:]PATH',
+                        help='Input files, optionally prefixed with their day')
+    parser.add_argument('--day', type=int, help='Day for inputs without a DAY: prefix')
+    parser.add_argument('--part', type=int, action='append', choices=PARTS,
+                        help='Part to run (repeatable, default: both)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per CPU)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Skip the persistent result cache (also: AOC_NO_CACHE=1)')
+    parser.add_argument('--cache-path', help='SQLite file for the result cache')
+    parser.add_argument('--profile', action='store_true',
+                        help='Attach per-phase timings, counters and peak memory '
+                             'to results')
+    parser.add_argument('--profile-dir',
+                        help='With --profile, also dump cProfile stats per phase here')
+    parser.add_argument('--async-io', action='store_true',
+                        help='Read inputs concurrently while earlier ones are '
+                             'being solved')
+    parser.add_argument('--read-concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='With --async-io, maximum files read at once')
+    parser.add_argument('--queue-size', type=int, default=None,
+                        help='With --async-io, maximum read files waiting for '
+                             'a solver (default: twice the workers)')
+    args = parser.parse_intermixed_args(argv)
+
+    solvers = discover_solvers()
+    try:
+        jobs = [parse_job(spec, args.day) for spec in args.jobs]
+    except ValueError as e:
+        parser.error(str(e))
+    for day, _ in jobs:
+        if day not in solvers:
+            parser.error(f"No solver registered for day {day}")
+
+    parts = tuple(args.part or PARTS)
+    options = dict(parts=parts, workers=args.workers, use_cache=not args.no_cache,
+                   cache_path=args.cache_path, profile=args.profile,
+                   profile_dir=args.profile_dir)
+    cache_counts = {'hits': 0, 'misses': 0}
+
+    def emit(record: dict) -> None:
+        if 'cached' in record:
+            cache_counts['hits' if record['cached'] else 'misses'] += 1
+        print(json.dumps(record), flush=True)
+
+    async def emit_ingested() -> None:
+        async for record in ingest_jobs(jobs, concurrency=args.read_concurrency,
+                                        queue_size=args.queue_size, **options):
+            emit(record)
+
+    if args.async_io:
+        asyncio.run(emit_ingested())
+    else:
+        for record in run_jobs(jobs, **options):
+            emit(record)
+
+    if cache_counts['hits'] or cache_counts['misses']:
+        print(json.dumps({'cache': cache_counts}), flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
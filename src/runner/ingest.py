@@ -0,0 +1,169 @@
+"""Asynchronous ingestion front end for the multi-day runner.
+
+Input files are read concurrently on an asyncio event loop while earlier
+files are already being solved, so slow storage (e.g. NFS) overlaps with
+compute instead of serializing with it. Reads go through aiofiles when it
+is installed and a thread executor otherwise. A semaphore caps how many
+reads are in flight and a bounded queue between readers and solvers gives
+backpressure: a reader only releases its slot once its file is queued, so
+at most concurrency + queue_size file contents are held in memory.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Iterable
+
+from src.commons.file_parser import InputFileError, input_file_errors
+from src.runner.pool import error_records, run_file_job
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+DEFAULT_CONCURRENCY = 8
+
+
+def read_input_bytes(filename: str) -> bytes:
+    """
+    Read a whole input file, reporting failures like the file parser does.
+
+    Args:
+        filename: Path to the input file
+
+    Returns:
+        The file contents
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be read
+    """
+    with input_file_errors(filename), open(filename, 'rb') as f:
+        return f.read()
+
+
+async def read_input_bytes_async(filename: str) -> bytes:
+    """
+    Read a whole input file without blocking the event loop.
+
+    Args:
+        filename: Path to the input file
+
+    Returns:
+        The file contents
+
+    Raises:
+        InputFileNotFoundError: If the file does not exist
+        InputFileError: If the file cannot be read
+    """
+    if aiofiles is None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, read_input_bytes, filename)
+
+    with input_file_errors(filename):
+        async with aiofiles.open(filename, 'rb') as f:
+            return await f.read()
+
+
+async def ingest_jobs(jobs: Iterable[tuple[int, str]], parts: tuple[int, ...] = (1, 2),
+                      workers: int | None = None,
+                      concurrency: int = DEFAULT_CONCURRENCY,
+                      queue_size: int | None = None, use_cache: bool = False,
+                      cache_path: str | None = None, profile: bool = False,
+                      profile_dir: str | None = None) -> AsyncIterator[dict]:
+    """
+    Read (day, file) jobs concurrently and solve them as they arrive.
+
+    Produces the same records as run_jobs. Solving happens in a process pool
+    (a single background thread when workers == 1), so the event loop keeps
+    reading later files while earlier ones are being solved.
+
+    Args:
+        jobs: Iterable of (day, filename) pairs
+        parts: Parts to run for every file
+        workers: Number of solver processes (default: one per CPU)
+        concurrency: Maximum number of files being read at once
+        queue_size: Maximum number of read files waiting for a solver
+                    (default: twice the number of workers)
+        use_cache: Consult and fill the persistent result cache
+        cache_path: SQLite file for the cache (default location if None)
+        profile: Attach per-phase instrumentation to each file's last record
+        profile_dir: Directory for per-phase cProfile dumps when profiling
+
+    Returns:
+        Async iterator over result records in completion order
+    """
+    workers = workers or os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    loaded = asyncio.Queue(maxsize=queue_size or 2 * workers)
+    finished = asyncio.Queue()
+    read_slots = asyncio.Semaphore(concurrency)
+    options = (use_cache, cache_path, profile, profile_dir)
+
+    async def read(day: int, filename: str) -> None:
+        try:
+            try:
+                content = await read_input_bytes_async(filename)
+            except InputFileError as e:
+                content = e
+            # Waits while the queue is full, holding the read slot
+            await loaded.put((day, filename, content))
+        finally:
+            read_slots.release()
+
+    async def produce() -> None:
+        readers = set()
+        try:
+            for day, filename in jobs:
+                await read_slots.acquire()
+                reader = asyncio.create_task(read(day, filename))
+                readers.add(reader)
+                reader.add_done_callback(readers.discard)
+            if readers:
+                await asyncio.gather(*readers)
+        finally:
+            for _ in range(workers):
+                await loaded.put(None)
+
+    async def solve(executor: Executor) -> None:
+        try:
+            while (item := await loaded.get()) is not None:
+                day, filename, content = item
+                if isinstance(content, InputFileError):
+                    records = error_records(day, filename, parts, content)
+                else:
+                    try:
+                        records = await loop.run_in_executor(
+                            executor, run_file_job, day, filename, parts, *options,
+                            content)
+                    except Exception as e:
+                        # e.g. a worker process that died
+                        records = error_records(day, filename, parts, e)
+                await finished.put(records)
+        finally:
+            await finished.put(None)
+
+    if workers == 1:
+        executor = ThreadPoolExecutor(max_workers=1)
+    else:
+        executor = ProcessPoolExecutor(workers)
+    with executor:
+        producer = asyncio.create_task(produce())
+        solvers = [asyncio.create_task(solve(executor)) for _ in range(workers)]
+        running = len(solvers)
+        try:
+            while running:
+                records = await finished.get()
+                if records is None:
+                    running -= 1
+                    continue
+                for record in records:
+                    yield record
+            await producer
+            for solver in solvers:
+                await solver
+        finally:
+            producer.cancel()
+            for solver in solvers:
+                solver.cancel()
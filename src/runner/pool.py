@@ -0,0 +1,204 @@
+"""Parallel execution of (day, file) jobs across a process pool."""
+
+import functools
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator
+
+from src.commons import instrumentation
+from src.commons.cache import ResultCache, hash_file, module_version
+from src.commons.file_parser import (
+    InputFileError, input_file_errors, iter_input_lines, load_parsed_input, parse_scope
+)
+from src.runner.registry import load_solver_module
+
+
+def _hash_input(filename: str, content: bytes | None = None) -> str:
+    """Hash an input file or its already-read bytes, reporting read failures."""
+    if content is not None:
+        return hashlib.blake2b(content, digest_size=32).hexdigest()
+    with input_file_errors(filename):
+        return hash_file(filename)
+
+
+def _load_input(module, filename: str, cache: ResultCache, key_prefix: tuple,
+                content: bytes | None = None) -> tuple[object, str]:
+    """
+    Load a file as the module's parsed model, or as raw lines without one.
+
+    When the file's bytes were already read (content), they are parsed
+    directly instead of opening the file again.
+
+    Returns:
+        tuple: (data, suffix) where suffix selects solve_partN or solve_partN_parsed
+    """
+    parser = getattr(module, 'parse_input', None)
+    if content is not None:
+        lines = content.decode().splitlines()
+        if parser is None:
+            return lines, ''
+        load = functools.partial(parser, lines)
+    else:
+        if parser is None:
+            return list(iter_input_lines(filename)), ''
+        load = functools.partial(load_parsed_input, filename, parser)
+
+    if not cache.enabled:
+        return load(), '_parsed'
+
+    key = cache.make_key(*key_prefix, 'parsed')
+    return cache.get_or_compute(key, load), '_parsed'
+
+
+def error_records(day: int, filename: str, parts: tuple[int, ...],
+                  error: Exception) -> list[dict]:
+    """
+    Build one error record per part for a file that could not be processed.
+
+    Args:
+        day: Day number
+        filename: Path to the input file
+        parts: Parts that were requested
+        error: Exception that stopped the job
+
+    Returns:
+        One record per part carrying the error message
+    """
+    message = _error_message(error)
+    return [{'day': day, 'part': part, 'file': filename, 'error': message}
+            for part in parts]
+
+
+def _error_message(error: Exception) -> str:
+    """Describe an error; expected input problems keep their plain message."""
+    if isinstance(error, (InputFileError, ValueError, KeyError)):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+def run_file_job(day: int, filename: str, parts: tuple[int, ...],
+                 use_cache: bool = False, cache_path: str | None = None,
+                 profile: bool = False, profile_dir: str | None = None,
+                 content: bytes | None = None) -> list[dict]:
+    """
+    Parse one input file once and run the requested parts on it.
+
+    Days that provide parse_input get the shared parsed model and their
+    solve_partN_parsed functions; other days get the raw lines. With the
+    cache enabled, part results and parsed models are looked up by input
+    hash first, and the file is only parsed when some part misses. Errors
+    are reported as records instead of raised, so one bad file does not
+    abort a batch.
+
+    Args:
+        day: Day number
+        filename: Path to the input file
+        parts: Parts to run, sharing the same loaded input
+        use_cache: Consult and fill the persistent result cache
+        cache_path: SQLite file for the cache (default location if None)
+        profile: Attach per-phase instrumentation to the last record
+        profile_dir: Directory for per-phase cProfile dumps when profiling
+        content: The file's bytes if already read (see src.runner.ingest)
+
+    Returns:
+        One result record per part
+    """
+    if not profile:
+        return _run_parts(day, filename, parts, use_cache, cache_path, content)
+
+    # Profiling is switched off again afterwards unless it was already on
+    with instrumentation.profiling(profile_dir):
+        instrumentation.reset()
+        records = _run_parts(day, filename, parts, use_cache, cache_path, content)
+        if records:
+            records[-1]['profile'] = instrumentation.report()
+
+    return records
+
+
+def _run_parts(day: int, filename: str, parts: tuple[int, ...], use_cache: bool,
+               cache_path: str | None, content: bytes | None) -> list[dict]:
+    """Run the parts of one job, as run_file_job does without profiling."""
+    try:
+        module = load_solver_module(day)
+        cache = ResultCache(cache_path, enabled=None if use_cache else False)
+    except Exception as e:
+        return error_records(day, filename, parts, e)
+
+    records = []
+    data = None
+    key_prefix = None
+
+    # Parsed models live only for this job, not for the worker's lifetime
+    with cache, parse_scope():
+        for part in parts:
+            record = {'day': day, 'part': part, 'file': filename}
+            start = time.perf_counter()
+            try:
+                found = False
+                if cache.enabled:
+                    if key_prefix is None:
+                        key_prefix = (_hash_input(filename, content),
+                                      module_version(module))
+                    result_key = cache.make_key(*key_prefix, f"part{part}")
+                    found, result = cache.get(result_key)
+                    record['cached'] = found
+
+                if not found:
+                    if data is None:
+                        data, suffix = _load_input(module, filename, cache,
+                                                   key_prefix, content)
+                    result = getattr(module, f"solve_part{part}{suffix}")(data)
+                    if cache.enabled:
+                        cache.put(result_key, result)
+
+                record['result'] = result
+            except Exception as e:
+                # Any failure, e.g. an OverflowError or a sqlite error, stays
+                # in its record
+                record['error'] = _error_message(e)
+            record['seconds'] = time.perf_counter() - start
+            records.append(record)
+
+    return records
+
+
+def run_jobs(jobs: Iterable[tuple[int, str]], parts: tuple[int, ...] = (1, 2),
+             workers: int | None = None, use_cache: bool = False,
+             cache_path: str | None = None, profile: bool = False,
+             profile_dir: str | None = None) -> Iterator[dict]:
+    """
+    Run (day, file) jobs and yield result records as they complete.
+
+    Each file is one task, so both parts share a single read of the input.
+    With workers == 1 jobs run in the calling process, in order.
+
+    Args:
+        jobs: Iterable of (day, filename) pairs
+        parts: Parts to run for every file
+        workers: Number of worker processes (default: one per CPU)
+        use_cache: Consult and fill the persistent result cache
+        cache_path: SQLite file for the cache (default location if None)
+        profile: Attach per-phase instrumentation to each file's last record
+        profile_dir: Directory for per-phase cProfile dumps when profiling
+
+    Returns:
+        Iterator over result records in completion order
+    """
+    options = (use_cache, cache_path, profile, profile_dir)
+
+    if workers == 1:
+        for day, filename in jobs:
+            yield from run_file_job(day, filename, parts, *options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_file_job, day, filename, parts, *options):
+                   (day, filename) for day, filename in jobs}
+        for future in as_completed(futures):
+            try:
+                yield from future.result()
+            except Exception as e:
+                # e.g. a worker process that died
+                yield from error_records(*futures[future], parts, e)
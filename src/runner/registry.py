@@ -0,0 +1,86 @@
+"""Solver registry that discovers day modules under src.days."""
+
+import functools
+import importlib
+import pkgutil
+import re
+
+import src.days
+
+DAY_PACKAGE_PATTERN = re.compile(r'day(\d+)$')
+PARTS = (1, 2)
+
+
+@functools.cache
+def discover_solvers() -> dict[int, str]:
+    """
+    Find every day package under src.days that provides solvers.
+
+    A day package dayN qualifies when its module src.days.dayN.dayN defines
+    solve_part1 and solve_part2. The scan runs once per process.
+
+    Returns:
+        Dict mapping day number to the solver module name, ordered by day
+
+    Raises:
+        ImportError: If a day's solver module exists but fails to import
+    """
+    solvers = {}
+
+    for module_info in pkgutil.iter_modules(src.days.__path__):
+        match = DAY_PACKAGE_PATTERN.match(module_info.name)
+        if not match or not module_info.ispkg:
+            continue
+
+        module_name = f"src.days.{module_info.name}.{module_info.name}"
+        try:
+            module = importlib.import_module(module_name)
+        except ModuleNotFoundError as e:
+            # A day package without a solver module is not a day yet, but a
+            # solver that fails on its own imports is a bug worth surfacing
+            if e.name != module_name:
+                raise
+            continue
+
+        if all(hasattr(module, f"solve_part{part}") for part in PARTS):
+            solvers[int(match.group(1))] = module_name
+
+    return dict(sorted(solvers.items()))
+
+
+def load_solver_module(day: int):
+    """
+    Import the solver module registered for a day.
+
+    Args:
+        day: Day number
+
+    Returns:
+        The src.days.dayN.dayN module
+
+    Raises:
+        KeyError: If no solver is registered for the day
+    """
+    solvers = discover_solvers()
+    if day not in solvers:
+        raise KeyError(f"No solver registered for day {day}")
+    return importlib.import_module(solvers[day])
+
+
+def get_solver(day: int, part: int):
+    """
+    Return the solve function for a day and part.
+
+    Args:
+        day: Day number
+        part: Part number (1 or 2)
+
+    Returns:
+        The module's solve_part{part} function
+
+    Raises:
+        KeyError: If no solver is registered for the day or part
+    """
+    if part not in PARTS:
+        raise KeyError(f"Unknown part: {part}")
+    return getattr(load_solver_module(day), f"solve_part{part}")
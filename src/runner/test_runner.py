@@ -0,0 +1,125 @@
+"""Tests for the multi-day runner."""
+
+from src.runner.pool import run_jobs
+from src.runner.registry import discover_solvers
+
+
+def test_discover_solvers():
+    """Test that every day package is registered."""
+    assert list(discover_solvers()) == [1, 2, 3, 4, 5]
+
+
+def test_discover_solvers_reports_broken_day(tmp_path, monkeypatch):
+    """Test that a day whose solver fails to import is reported, not skipped."""
+    import pytest
+    import src.days
+    (tmp_path / 'day98').mkdir()
+    (tmp_path / 'day98' / '__init__.py').write_text('')
+    (tmp_path / 'day99').mkdir()
+    (tmp_path / 'day99' / '__init__.py').write_text('')
+    (tmp_path / 'day99' / 'day99.py').write_text(
+        'import missing_dependency_for_day99\n')
+    monkeypatch.setattr(src.days, '__path__', [*src.days.__path__, str(tmp_path)])
+    discover_solvers.cache_clear()
+    try:
+        with pytest.raises(ImportError, match='missing_dependency_for_day99'):
+            discover_solvers()
+    finally:
+        monkeypatch.undo()
+        discover_solvers.cache_clear()
+    assert list(discover_solvers()) == [1, 2, 3, 4, 5]
+
+
+def test_run_jobs_across_pool():
+    """Test pooled runs against the demo answers, including a missing file."""
+    jobs = [(3, 'src/days/day3/demo.txt'), (4, 'src/days/day4/demo.txt'),
+            (4, 'src/days/day4/missing.txt')]
+    records = list(run_jobs(jobs, workers=2))
+    results = {(r['day'], r['part'], r['file']): r.get('result') for r in records}
+    assert results[(3, 1, 'src/days/day3/demo.txt')] == 357
+    assert results[(4, 2, 'src/days/day4/demo.txt')] == 43
+    assert sum('error' in r for r in records) == 2
+
+
+def test_run_jobs_reuses_cached_results(tmp_path):
+    """Test that a repeated run answers from the persistent cache."""
+    cache_path = str(tmp_path / 'cache.sqlite3')
+    jobs = [(1, 'src/days/day1/demo.txt')]
+    first = list(run_jobs(jobs, workers=1, use_cache=True, cache_path=cache_path))
+    second = list(run_jobs(jobs, workers=1, use_cache=True, cache_path=cache_path))
+    assert [r['cached'] for r in first] == [False, False]
+    assert [r['cached'] for r in second] == [True, True]
+    assert [r['result'] for r in second] == [3, 6]
+
+
+def test_run_jobs_with_profile():
+    """Test that profiling attaches per-phase timings and counters."""
+    import tracemalloc
+    from src.commons import instrumentation
+    records = list(run_jobs([(5, 'src/days/day5/demo.txt')], workers=1, profile=True))
+    # An in-process job leaves instrumentation as it found it
+    assert not instrumentation.is_enabled()
+    assert not tracemalloc.is_tracing()
+    profile = records[-1]['profile']
+    assert set(profile['phases']) == {'day5.parse', 'day5.part1', 'day5.part2'}
+    assert profile['phases']['day5.part1']['calls'] == 1
+    assert profile['counters'] == {'day5.ranges': 4, 'day5.seeds': 6}
+
+
+def test_async_ingestion_matches_run_jobs():
+    """Test the async pipeline against run_jobs, with a small queue and read limit."""
+    import asyncio
+    from src.runner.ingest import ingest_jobs
+    jobs = [(day, f'src/days/day{day}/demo.txt') for day in (1, 2, 3, 4, 5)]
+    jobs += [(3, 'src/days/day3/demo.txt'), (4, 'src/days/day4/missing.txt')]
+
+    async def collect(workers):
+        records = ingest_jobs(jobs, workers=workers, concurrency=2, queue_size=1)
+        return [record async for record in records]
+
+    def key(record):
+        return record['day'], record['part'], record['file'], record.get('result')
+
+    expected = sorted(map(key, run_jobs(jobs, workers=1)), key=str)
+    for workers in (1, 2):
+        records = asyncio.run(collect(workers))
+        assert sorted(map(key, records), key=str) == expected
+        assert sum('error' in r for r in records) == 2
+
+
+def test_unexpected_errors_do_not_abort_batch(monkeypatch):
+    """Test that a solver failure outside ValueError becomes an error record."""
+    from src.days.day5 import day5
+
+    def overflow(parsed):
+        raise OverflowError('value too large')
+
+    monkeypatch.setattr(day5, 'solve_part1_parsed', overflow)
+    jobs = [(5, 'src/days/day5/demo.txt'), (3, 'src/days/day3/demo.txt')]
+    records = list(run_jobs(jobs, workers=1))
+    errors = [r for r in records if 'error' in r]
+    assert [(r['day'], r['part'], r['error']) for r in errors] == [
+        (5, 1, 'OverflowError: value too large')]
+    results = {(r['day'], r['part']): r.get('result') for r in records}
+    assert results[(3, 2)] == 3121910778619
+
+
+def test_streaming_solvers_are_timed():
+    """Test that streamed and memory-mapped solver paths record their phases."""
+    from src.commons import instrumentation
+    from src.commons.file_parser import iter_input_lines
+    from src.commons.grid import MappedGrid
+    from src.days.day1 import day1
+    from src.days.day4 import day4
+    from src.days.day5 import day5
+    with instrumentation.profiling():
+        instrumentation.reset()
+        assert day1.solve_part2(iter_input_lines('src/days/day1/demo.txt')) == 6
+        assert day5.solve_part1(iter_input_lines('src/days/day5/demo.txt')) == 3
+        with MappedGrid('src/days/day4/demo.txt') as grid:
+            assert day4.solve_part2(grid) == 43
+        phases = instrumentation.report()['phases']
+        instrumentation.reset()
+    expected = {'day1.parse', 'day1.part2', 'day5.parse', 'day5.part1', 'day4.part2'}
+    assert expected <= set(phases)
+    assert not instrumentation.is_enabled()